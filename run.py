@@ -47,6 +47,13 @@ def main():
             # Windows asyncio 연결 오류 로깅 억제
             import logging
             logging.getLogger('asyncio').setLevel(logging.WARNING)
+        else:
+            # uvloop 이벤트 루프 사용 (uvicorn[standard]에 포함, 없으면 기본 루프 유지)
+            try:
+                import uvloop
+                uvloop.install()
+            except ImportError:
+                pass
 
         # 초기화 실행
         asyncio.run(startup())
@@ -40,6 +40,22 @@ class Settings(BaseSettings):
     HEADLESS_MODE: bool = True
     ENABLE_SCHEDULER: bool = False
 
+    # G2B API 커넥션 풀 설정
+    G2B_POOL_LIMIT: int = 20
+    G2B_POOL_LIMIT_PER_HOST: int = 8
+    G2B_KEEPALIVE_TIMEOUT: int = 60
+    G2B_MAX_INFLIGHT_REQUESTS: int = 4
+    G2B_MAX_PAGES: int = 20
+
+    # IT MEPA 커넥션 풀 설정 (RSS/웹 검색/CONSIP 수집이 같은 풀을 동시에 사용)
+    IT_MEPA_POOL_LIMIT: int = 10
+    IT_MEPA_POOL_LIMIT_PER_HOST: int = 6
+    IT_MEPA_KEEPALIVE_TIMEOUT: int = 60
+
+    # 전체 크롤러 동시 실행 상한 / TED 호스트별 요청 속도 (TED, Sweden 인스턴스가 공유)
+    CRAWLER_MAX_CONCURRENCY: int = 4
+    TED_HOST_RATE_LIMIT_TPS: float = 5.0
+
     # 로깅 설정
     LOG_LEVEL: str = "INFO"
     
@@ -7,7 +7,8 @@ import asyncio
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -24,9 +25,61 @@ from src.database.connection import DatabaseManager
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _expand_relevance_keywords(keywords: Tuple[str, ...]) -> tuple:
+    """관련성 점수용 확장 키워드 (키워드 조합이 같으면 모든 항목/크롤러가 재사용)"""
+    from src.utils.keyword_expansion import keyword_engine
+    from src.models.advanced_filters import KeywordExpansion
+
+    expansion_config = KeywordExpansion(
+        enable_synonyms=True,
+        enable_related_terms=True,
+        enable_translations=True,
+        enable_abbreviations=True,
+        max_expansions_per_keyword=3
+    )
+
+    return tuple(keyword_engine.expand_keywords(list(keywords), expansion_config))
+
+
+@lru_cache(maxsize=4096)
+def _score_relevance(
+    title: str,
+    description: str,
+    keywords: Tuple[str, ...],
+    high_value_terms: Tuple[str, ...],
+) -> float:
+    """관련성 점수 계산 (같은 공고가 키워드/카테고리/주기별로 반복 수집되므로 캐시)"""
+    from src.utils.keyword_expansion import keyword_engine
+
+    # 기본 키워드로 확장된 키워드 (항목마다 다시 확장하지 않도록 캐시)
+    expanded_keywords = _expand_relevance_keywords(keywords)
+
+    # 향상된 관련성 점수 계산
+    text = f"{title} {description}"
+    score = keyword_engine.calculate_enhanced_relevance(text, expanded_keywords)
+
+    # 추가 점수 요소
+    text_lower = text.lower()
+    for term in high_value_terms:
+        if term in text_lower:
+            score += 0.3
+
+    # 제목에서의 매칭에 추가 가중치
+    title_lower = title.lower()
+    for expanded_kw in expanded_keywords:
+        if expanded_kw.keyword.lower() in title_lower:
+            score += 0.2 * expanded_kw.weight
+
+    return min(score, 10.0)  # 최대 10점
+
+
 class BaseCrawler(ABC):
     """크롤러 기본 클래스"""
 
+    # 관련성 가산점 용어 (소문자로 보관)
+    HIGH_VALUE_TERMS = ('대량', 'bulk', '긴급', 'urgent', '우선', 'priority', '특급', 'express')
+
     def __init__(self, site_name: str, country: str = "KR"):
         self.site_name = site_name
         self.country = country
@@ -138,44 +191,13 @@ class BaseCrawler(ABC):
 
     def calculate_relevance_score(self, title: str, description: str = "") -> float:
         """향상된 관련성 점수 계산"""
-        from src.utils.keyword_expansion import keyword_engine
-        from src.models.advanced_filters import KeywordExpansion
-
-        # 기본 키워드로 확장된 키워드 생성
-        all_keywords = []
-        all_keywords.extend(crawler_config.SEEGENE_KEYWORDS['korean'])
-        all_keywords.extend(crawler_config.SEEGENE_KEYWORDS['english'])
-
-        # 키워드 확장
-        expansion_config = KeywordExpansion(
-            enable_synonyms=True,
-            enable_related_terms=True,
-            enable_translations=True,
-            enable_abbreviations=True,
-            max_expansions_per_keyword=3
+        return _score_relevance(
+            title,
+            description,
+            tuple(crawler_config.SEEGENE_KEYWORDS['korean']) + tuple(crawler_config.SEEGENE_KEYWORDS['english']),
+            self.HIGH_VALUE_TERMS,
         )
 
-        expanded_keywords = keyword_engine.expand_keywords(all_keywords, expansion_config)
-
-        # 향상된 관련성 점수 계산
-        text = f"{title} {description}"
-        score = keyword_engine.calculate_enhanced_relevance(text, expanded_keywords)
-
-        # 추가 점수 요소
-        text_lower = text.lower()
-        high_value_terms = ['대량', 'bulk', '긴급', 'urgent', '우선', 'priority', '특급', 'express']
-        for term in high_value_terms:
-            if term.lower() in text_lower:
-                score += 0.3
-
-        # 제목에서의 매칭에 추가 가중치
-        title_lower = title.lower()
-        for expanded_kw in expanded_keywords:
-            if expanded_kw.keyword.lower() in title_lower:
-                score += 0.2 * expanded_kw.weight
-
-        return min(score, 10.0)  # 최대 10점
-
     def determine_urgency_level(self, deadline_str: str) -> str:
         """긴급도 레벨 결정"""
         try:
@@ -262,8 +284,8 @@ class BaseCrawler(ABC):
         logger.info(f"{self.site_name} 크롤링 시작")
 
         try:
-            # WebDriver 설정
-            self.setup_driver()
+            # WebDriver 설정 (드라이버 설치/기동은 블로킹이므로 스레드에서 실행)
+            await asyncio.to_thread(self.setup_driver)
 
             # 더미 모드 비활성화 - API 전용 모드로 진행
 
@@ -305,4 +327,4 @@ class BaseCrawler(ABC):
             }
 
         finally:
-            self.teardown_driver()
\ No newline at end of file
+            await asyncio.to_thread(self.teardown_driver)
\ No newline at end of file
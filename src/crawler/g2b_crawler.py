@@ -3,17 +3,248 @@
 import asyncio
 import aiohttp
 import json
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from urllib.parse import quote
+from functools import lru_cache
+from typing import List, Dict, Any, AsyncIterator, Optional, Set, Tuple
+from urllib.parse import quote, urlencode
+
+from yarl import URL
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # bytes를 직접 파싱 (JSONDecodeError는 json.JSONDecodeError 하위 클래스)
+except ImportError:  # orjson이 없는 경우 표준 json 사용
+    _json_loads = json.loads
 
 from src.crawler.base import BaseCrawler
-from src.config import settings
+from src.config import settings, crawler_config
 from src.database.connection import DatabaseManager
+from src.utils.keyword_matcher import KeywordMatcher, build_keyword_matcher
 from src.utils.logger import get_logger
+from src.utils.rate_limiter import AsyncRateLimiter
+from src.utils.retry import RETRYABLE_STATUSES, get_retry_delay
 
 logger = get_logger(__name__)
 
+# BidPublicInfoService 응답 필드 후보 키 (앞선 키가 우선)
+TITLE_KEYS = ('bidNtceNm', 'ntceNm', 'bidNm')
+ORGANIZATION_KEYS = ('ntceInsttNm', 'dminsttNm', 'insttNm')
+DEADLINE_KEYS = ('bidClseDt', 'bidClseDt1', 'bidClseDt2')
+ESTIMATED_PRICE_KEYS = ('presmptPrce', 'asignBdgtAmt', 'bdgtAmt', 'refAmt')
+ANNOUNCEMENT_DATE_KEYS = ('bidNtceDt', 'rgstDt', 'ntceDt')
+BUDGET_AMOUNT_KEYS = ('asignBdgtAmt', 'bdgtAmt', 'presmptPrce')
+DETAIL_URL_KEYS = ('bidNtceDtlUrl', 'bidNtceUrl')
+CONTRACT_METHOD_KEYS = ('cntrctCnclsMthdNm', 'cntrctMthdNm')
+BID_QUALIFICATION_KEYS = ('bidQlfctNm', 'bidPrtcptQlfctNm')
+OPENING_DATE_KEYS = ('opengDt', 'bidOpenDt')
+OPENING_PLACE_KEYS = ('opengPlce', 'bidOpenPlce')
+CONTACT_NAME_KEYS = ('ofclNm', 'chrgePerNm')
+CONTACT_PHONE_KEYS = ('ofclTelNo', 'chrgePerTel')
+CONTACT_EMAIL_KEYS = ('ofclEmail', 'chrgePerEmail')
+REFERENCE_NUMBER_KEYS = ('refNo', 'bidNtceRefNo')
+NOTICE_DIVISION_KEYS = ('ntceDivNm', 'ntceKindNm')
+VAT_INCLUDED_KEYS = ('vatInclsnYnNm', 'vatYnNm')
+REGION_LIMIT_KEYS = ('rgnLmtDivNm', 'bidAreaLmtYnNm')
+
+# 키워드 통과 후 한 번에 추출하는 상세 필드 (필드명, 후보 키)
+DETAIL_FIELD_KEYS = (
+    ('deadline_date', DEADLINE_KEYS),
+    ('estimated_price', ESTIMATED_PRICE_KEYS),
+    ('announcement_date', ANNOUNCEMENT_DATE_KEYS),
+    ('budget_amount', BUDGET_AMOUNT_KEYS),
+    ('detail_url', DETAIL_URL_KEYS),
+    ('contract_method', CONTRACT_METHOD_KEYS),
+    ('bid_qualification', BID_QUALIFICATION_KEYS),
+    ('opening_date', OPENING_DATE_KEYS),
+    ('opening_place', OPENING_PLACE_KEYS),
+    ('contact_name', CONTACT_NAME_KEYS),
+    ('contact_phone', CONTACT_PHONE_KEYS),
+    ('contact_email', CONTACT_EMAIL_KEYS),
+    ('reference_number', REFERENCE_NUMBER_KEYS),
+    ('notice_division', NOTICE_DIVISION_KEYS),
+    ('vat_included', VAT_INCLUDED_KEYS),
+    ('region_limit', REGION_LIMIT_KEYS),
+)
+
+# 압축 응답 명시 요청 (일부 data.go.kr 게이트웨이는 요청 시에만 gzip 적용)
+API_REQUEST_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+# XML 오류 응답 시작 부분 (JSON 요청에도 인증 오류는 XML로 반환됨)
+XML_ERROR_PREFIXES = (b'<OpenAPI_ServiceResponse>', b'<?xml')
+WHITESPACE_BYTES = frozenset(b' \t\r\n')
+ERROR_LOG_BYTES = 1024  # 오류 응답 로그 최대 길이
+
+# 날짜 형식 후보 (입력 길이가 일치하는 형식을 먼저 시도)
+DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y%m%d%H%M%S",
+    "%Y%m%d%H%M",
+    "%Y%m%d",
+    "%Y/%m/%d",
+    "%Y.%m.%d",
+)
+DATE_FORMATS_BY_LENGTH = {
+    19: ("%Y-%m-%d %H:%M:%S",),
+    16: ("%Y-%m-%d %H:%M",),
+    14: ("%Y%m%d%H%M%S",),
+    12: ("%Y%m%d%H%M",),
+    10: ("%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d"),
+    8: ("%Y%m%d",),
+}
+# 연도 뒤 구분자별 마감일 형식 (맞지 않는 형식의 strptime 예외를 피함)
+DEADLINE_FORMATS_BY_SEPARATOR = {
+    "-": ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"),
+    "/": ("%Y/%m/%d",),
+    ".": ("%Y.%m.%d",),
+}
+
+# 마감일 빠른 경로에서 숫자로 읽을 위치 (YYYY, MM, DD, HH, MM, SS)
+DEADLINE_FIELD_SLICES = (
+    slice(0, 4), slice(5, 7), slice(8, 10), slice(11, 13), slice(14, 16), slice(17, 19),
+)
+COMPACT_FIELD_SLICES = (
+    slice(0, 4), slice(4, 6), slice(6, 8), slice(8, 10), slice(10, 12), slice(12, 14),
+)
+
+# 날짜 빠른 경로: 숫자를 'd'로 바꾼 모양이 DATE_FORMATS 중 하나와 정확히 같을 때만 사용
+DIGIT_SHAPE_TABLE = str.maketrans("0123456789", "d" * 10)
+DATE_FIELD_SLICES_BY_SHAPE = {
+    "dddd-dd-dd dd:dd:dd": DEADLINE_FIELD_SLICES,
+    "dddd-dd-dd dd:dd": DEADLINE_FIELD_SLICES[:5],
+    "dddd-dd-dd": DEADLINE_FIELD_SLICES[:3],
+    "dddd/dd/dd": DEADLINE_FIELD_SLICES[:3],
+    "dddd.dd.dd": DEADLINE_FIELD_SLICES[:3],
+    "dddddddddddddd": COMPACT_FIELD_SLICES,
+    "dddddddddddd": COMPACT_FIELD_SLICES[:5],
+    "dddddddd": COMPACT_FIELD_SLICES[:3],
+}
+
+
+def _response_head(data: bytes, size: int = 64) -> bytes:
+    """앞쪽 공백을 건너뛴 응답 시작 부분 (memoryview로 본문 복사 없이 탐색)"""
+    view = memoryview(data)
+    start = 0
+    length = len(view)
+    while start < length and view[start] in WHITESPACE_BYTES:
+        start += 1
+    return bytes(view[start:start + size])
+
+
+def _preview_bytes(data: bytes, limit: int) -> str:
+    """로그용 응답 미리보기 (앞부분만 디코딩)"""
+    return bytes(memoryview(data)[:limit]).decode('utf-8', errors='replace')
+
+
+@lru_cache(maxsize=4096)
+def _normalize_date(value: str) -> str:
+    """날짜 문자열을 YYYY-MM-DD로 변환 (공고일이 겹치는 경우가 많아 캐시)"""
+    # 대부분의 응답은 형식 그대로이므로 strptime 없이 필드를 읽어 검증
+    # (연도가 0으로 시작하면 strftime의 %Y 출력이 달라지므로 strptime으로 처리)
+    field_slices = DATE_FIELD_SLICES_BY_SHAPE.get(value.translate(DIGIT_SHAPE_TABLE))
+    if field_slices and value[0] != '0':
+        fields = [value[field_slice] for field_slice in field_slices]
+        try:
+            datetime(*map(int, fields))  # 존재하는 날짜/시각인지 검증
+            return f"{fields[0]}-{fields[1]}-{fields[2]}"
+        except ValueError:
+            pass
+
+    preferred = DATE_FORMATS_BY_LENGTH.get(len(value), ())
+    fallback = tuple(fmt for fmt in DATE_FORMATS if fmt not in preferred)
+
+    for fmt in preferred + fallback:
+        try:
+            return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+
+    if len(value) >= 10:
+        return value[:10]
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _parse_deadline_value(value: str) -> Optional[datetime]:
+    """마감일 문자열을 datetime으로 변환 (API 기본 형식은 strptime 없이 길이로 분기)"""
+    length = len(value)
+    field_slices = ()
+    # YYYY-MM-DD HH:MM:SS
+    if length == 19 and value[4] == value[7] == '-' and value[10] == ' ' and value[13] == value[16] == ':':
+        field_slices = DEADLINE_FIELD_SLICES
+    # YYYY-MM-DD, YYYY/MM/DD, YYYY.MM.DD
+    elif length == 10 and value[4] == value[7] and value[4] in '-/.':
+        field_slices = DEADLINE_FIELD_SLICES[:3]
+
+    if field_slices:
+        # int()는 공백/부호도 받아들이므로 각 자리가 숫자인 경우만 바로 변환 (나머지는 strptime으로 판정)
+        fields = [value[field_slice] for field_slice in field_slices]
+        if all(field.isdigit() for field in fields):
+            try:
+                return datetime(*map(int, fields))
+            except ValueError:
+                pass
+
+    separator = value[4] if length > 4 else ""
+    for fmt in DEADLINE_FORMATS_BY_SEPARATOR.get(separator, ()):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+class _PriceCharTable(dict):
+    """str.translate용 테이블: 숫자와 '.'만 남기고 삭제 (처음 보는 문자만 판정 후 캐시)"""
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        kept = codepoint if char.isdigit() or char == '.' else None
+        self[codepoint] = kept
+        return kept
+
+
+PRICE_CHAR_TABLE = _PriceCharTable()
+
+
+@lru_cache(maxsize=8192)
+def _normalize_price(value: str) -> str:
+    """가격 문자열을 '1,234원' 형식으로 변환 (추정가격/예산이 중복되는 경우가 많아 캐시)"""
+    normalized = value.replace(",", "")
+
+    # 대부분의 응답은 정수 문자열이므로 float 변환 없이 처리
+    if normalized.isascii() and normalized.isdigit():
+        return f"{int(normalized):,}원"
+
+    try:
+        price_num = float(normalized)
+    except ValueError:
+        filtered = normalized.translate(PRICE_CHAR_TABLE)
+        if not filtered:
+            return value
+        try:
+            price_num = float(filtered)
+        except ValueError:
+            return value
+
+    return f"{int(price_num):,}원"
+
+
+@dataclass
+class _SearchContext:
+    """검색 호출 단위 상태 (같은 크롤러 인스턴스로 검색이 겹쳐도 서로 덮어쓰지 않도록 호출마다 생성)"""
+    crawled_at: str
+    search_window: Tuple[datetime, datetime]
+    # 검색 중 이미 수집한 (공고번호, 차수) - 다른 키워드/페이지에서 다시 나온 공고는 변환 생략
+    seen_bid_keys: Set[Tuple[str, str]] = field(default_factory=set)
+    # 검색 동안 공유하는 HTTP 세션과 동시 요청 제한 (없으면 요청마다 임시 세션/제한 없음)
+    session: Optional[aiohttp.ClientSession] = None
+    request_semaphore: Optional[asyncio.Semaphore] = None
+
 
 class G2BCrawler(BaseCrawler):
     """나라장터(G2B) API 크롤러"""
@@ -42,11 +273,41 @@ class G2BCrawler(BaseCrawler):
         self.api_request_timeout = aiohttp.ClientTimeout(total=20)
         self.api_rate_limit_tps = 30
         self.api_rows_per_page = 50  # 페이지 크기 줄여서 API 제한 회피
+        self.api_max_pages = settings.G2B_MAX_PAGES  # 카테고리당 최대 조회 페이지 수
+        self.api_max_concurrency = len(self.operations)  # 동시 검색 워커 수
+        self.api_connection_limit = settings.G2B_POOL_LIMIT
+        self.api_connection_limit_per_host = settings.G2B_POOL_LIMIT_PER_HOST
+        self.api_keepalive_timeout = settings.G2B_KEEPALIVE_TIMEOUT
+        self.api_dns_cache_ttl = 300  # 검색 동안 같은 호스트만 호출하므로 DNS 결과를 길게 캐시
+        self.api_max_inflight_requests = settings.G2B_MAX_INFLIGHT_REQUESTS  # 동시 API 요청 상한
+        self.api_max_retries = 2  # 일시적 오류(429/5xx, 연결 오류) 재시도 횟수
+        self.api_retry_backoff = 0.5
+        self.api_retry_max_delay = 10.0
+
+        # 모든 워커/페이지 요청이 공유하는 초당 요청 수 제한
+        self._rate_limiter = AsyncRateLimiter(self.api_rate_limit_tps)
 
         # 공공데이터개방표준서비스 설정 (백업용)
         self.standard_api_base_url = "https://apis.data.go.kr/1230000/ao/PubDataOpnStdService"
         self.standard_operation = "getDataSetOpnStdBidPblancInfo"
 
+        # 요청 URL과 공통 파라미터는 생성 시 한 번만 구성
+        self._operation_urls: Dict[Tuple[str, str], str] = {
+            (base_url, operation): f"{base_url}/{operation}"
+            for base_url in self.api_base_url_candidates
+            for operation, _ in self.operations.values()
+        }
+        self.standard_api_url = f"{self.standard_api_base_url}/{self.standard_operation}"
+        self._base_request_params: Dict[str, Any] = {
+            "ServiceKey": self.encoded_api_key,
+            "type": "json",
+            "numOfRows": self.api_rows_per_page,
+        }
+
+        # Seegene 키워드 매처 (Aho-Corasick) - 검색 시작 시 한 번만 구성
+        self._seegene_matcher = KeywordMatcher(())
+        self._prepare_keyword_cache()
+
     async def login(self) -> bool:
         """API 기반이므로 로그인 불필요"""
         if not self.encoded_api_key:
@@ -71,7 +332,65 @@ class G2BCrawler(BaseCrawler):
             logger.warning("G2B API 키가 없어 검색 불가")
             return []
 
+        # 모든 카테고리/페이지 요청이 하나의 커넥션 풀(keep-alive)을 공유
+        connector = aiohttp.TCPConnector(
+            limit=self.api_connection_limit,
+            limit_per_host=self.api_connection_limit_per_host,
+            keepalive_timeout=self.api_keepalive_timeout,
+            ttl_dns_cache=self.api_dns_cache_ttl,
+        )
+        async with aiohttp.ClientSession(
+            timeout=self.api_request_timeout,
+            connector=connector,
+            headers=API_REQUEST_HEADERS,
+        ) as session:
+            # 세션/요청 제한/수집 상태는 호출마다 만들어 하위 호출에 전달 (인스턴스에 저장하지 않음)
+            context = self._new_search_context(
+                session=session,
+                request_semaphore=asyncio.Semaphore(self.api_max_inflight_requests),
+            )
+            return await self._search_all_keywords(keywords, context)
+
+    def _new_search_context(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        request_semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> _SearchContext:
+        """수집 시각과 조회 기간을 검색 단위로 한 번만 계산한 검색 상태 생성"""
+        now = datetime.now()
+        return _SearchContext(
+            crawled_at=now.isoformat(),
+            search_window=(now - timedelta(days=30), now),  # 30일로 단축하여 API 제한 회피
+            session=session,
+            request_semaphore=request_semaphore,
+        )
+
+    @asynccontextmanager
+    async def _api_session(self, context: _SearchContext) -> AsyncIterator[aiohttp.ClientSession]:
+        """검색 공유 세션을 반환 (search_bids 외부에서 호출된 경우 임시 세션 생성)"""
+        if context.session is not None and not context.session.closed:
+            yield context.session
+            return
+
+        async with aiohttp.ClientSession(timeout=self.api_request_timeout, headers=API_REQUEST_HEADERS) as session:
+            yield session
+
+    @asynccontextmanager
+    async def _request_slot(self, context: _SearchContext) -> AsyncIterator[None]:
+        """동시 API 요청 수(검색 중)와 초당 요청 수를 제한 (워커/엔드포인트가 늘어나도 상한 유지)"""
+        if context.request_semaphore is None:
+            await self._rate_limiter.acquire()
+            yield
+            return
+
+        async with context.request_semaphore:
+            await self._rate_limiter.acquire()
+            yield
+
+    async def _search_all_keywords(self, keywords: List[str], context: _SearchContext) -> List[Dict[str, Any]]:
+        """키워드 x 카테고리 검색 실행, 중복 제거 및 저장"""
         all_results: List[Dict[str, Any]] = []
+        self._prepare_keyword_cache()
 
         try:
             # 키워드가 제공되지 않은 경우 기본 키워드 사용
@@ -82,7 +401,7 @@ class G2BCrawler(BaseCrawler):
             logger.info(f"🔍 검색 키워드: {keywords}")
 
             # API 서비스 가용성 사전 체크
-            service_available = await self._check_api_service_availability()
+            service_available = await self._check_api_service_availability(context)
             if not service_available:
                 logger.error("🚫 G2B API 서비스가 현재 이용 불가능합니다")
                 logger.error("💡 해결 방법:")
@@ -91,51 +410,25 @@ class G2BCrawler(BaseCrawler):
                 logger.error("   3. 대안: 나라장터 웹사이트 직접 크롤링 고려")
                 return []
 
-            # 각 키워드별로 개별 검색
-            successful_searches = 0
-            for i, keyword in enumerate(keywords, 1):
-                try:
-                    logger.info(f"[{i}/{len(keywords)}] 키워드 '{keyword}' 검색 중...")
-                    keyword_results = []
-
-                    # BidPublicInfoService API 검색 (카테고리별)
-                    for category, (operation, label) in self.operations.items():
-                        log_label = label if label == category else f"{label}({category})"
-                        logger.info(f"  📡 [{keyword}] {log_label} 카테고리 검색")
-
-                        results = await self._search_bid_public_info(
-                            operation, category, [keyword], display_name=label
-                        )
-
-                        if results:
-                            keyword_results.extend(results)
-                            logger.info(f"  ✅ [{keyword}] {log_label}에서 {len(results)}건 수집")
-                            successful_searches += 1
-                        else:
-                            logger.info(f"  ⚪ [{keyword}] {log_label} 검색 결과 없음")
-
-                        await asyncio.sleep(0.5)  # 카테고리 간 짧은 대기
-
-                    # 표준 API로도 검색 (일시적으로 비활성화 - 성능 개선)
-                    # try:
-                    #     standard_results = await self._search_standard_api([keyword])
-                    #     if standard_results:
-                    #         keyword_results.extend(standard_results)
-                    #         logger.info(f"  📦 [{keyword}] 표준 API에서 {len(standard_results)}건 추가")
-                    # except Exception as e:
-                    #     logger.warning(f"  ⚠️ [{keyword}] 표준 API 검색 실패: {e}")
-                    logger.info(f"  ⏭️ [{keyword}] 표준 API 검색 스킵 (성능 최적화)")
-
-                    all_results.extend(keyword_results)
-                    logger.info(f"✅ 키워드 '{keyword}' 총 {len(keyword_results)}건 수집")
-
-                    # 키워드 간 대기 (API 제한 준수)
-                    if i < len(keywords):
-                        await asyncio.sleep(1)
+            # (키워드, 카테고리) 작업을 큐에 넣고 고정 개수의 워커가 소비
+            # 워커 수로 동시 요청을 제한하므로 키워드/카테고리 간 고정 대기가 필요 없다
+            job_queue: asyncio.Queue = asyncio.Queue()
+            for keyword in keywords:
+                for category, (operation, label) in self.operations.items():
+                    job_queue.put_nowait((keyword, category, operation, label))
+
+            results_by_keyword: Dict[str, List[Dict[str, Any]]] = {keyword: [] for keyword in keywords}
+            worker_count = min(self.api_max_concurrency, job_queue.qsize())
+            success_counts = await asyncio.gather(
+                *[self._search_worker(job_queue, results_by_keyword, context) for _ in range(worker_count)]
+            )
+            successful_searches = sum(success_counts)
 
-                except Exception as e:
-                    logger.warning(f"⚠️ 키워드 '{keyword}' 검색 실패: {e}")
-                    continue
+            # 표준 API 검색은 일시적으로 비활성화 (성능 개선) - 필요 시 _search_standard_api 사용
+            for i, keyword in enumerate(keywords, 1):
+                keyword_results = results_by_keyword[keyword]
+                all_results.extend(keyword_results)
+                logger.info(f"✅ [{i}/{len(keywords)}] 키워드 '{keyword}' 총 {len(keyword_results)}건 수집")
 
             # 검색 결과 요약
             if successful_searches == 0:
@@ -151,11 +444,15 @@ class G2BCrawler(BaseCrawler):
 
             logger.info(f"✅ G2B 키워드별 검색 완료: 전체 {len(all_results)}건 수집 → 중복 제거 후 {len(unique_results)}건")
 
-            # 데이터베이스에 저장
-            if unique_results:
+            # 데이터베이스에 저장 (이전 실행에서 이미 저장된 공고는 제외)
+            new_results = await self._filter_unsaved_results(unique_results)
+            if new_results:
                 try:
-                    await DatabaseManager.save_bid_info(unique_results)
-                    logger.info(f"💾 G2B 데이터베이스 저장 완료: {len(unique_results)}건")
+                    await DatabaseManager.save_bid_info(new_results)
+                    logger.info(
+                        f"💾 G2B 데이터베이스 저장 완료: {len(new_results)}건 "
+                        f"(기존 저장 {len(unique_results) - len(new_results)}건 제외)"
+                    )
                 except Exception as e:
                     logger.error(f"❌ G2B 데이터베이스 저장 실패: {e}")
             else:
@@ -167,6 +464,45 @@ class G2BCrawler(BaseCrawler):
             logger.error(f"❌ G2B API 검색 중 오류: {e}")
             return all_results
 
+    async def _search_worker(
+        self,
+        job_queue: asyncio.Queue,
+        results_by_keyword: Dict[str, List[Dict[str, Any]]],
+        context: _SearchContext,
+    ) -> int:
+        """작업 큐에서 (키워드, 카테고리)를 꺼내 검색하고 성공한 검색 수를 반환"""
+        successful_searches = 0
+
+        while True:
+            try:
+                keyword, category, operation, label = job_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return successful_searches
+
+            log_label = label if label == category else f"{label}({category})"
+            logger.info(f"  📡 [{keyword}] {log_label} 카테고리 검색")
+
+            try:
+                results = await self._search_bid_public_info(
+                    operation, category, [keyword], display_name=label, context=context
+                )
+            except Exception as e:
+                logger.warning(f"  ⚠️ [{keyword}] {log_label} 검색 실패: {e}")
+                continue
+            finally:
+                job_queue.task_done()
+
+            if results:
+                results_by_keyword[keyword].extend(results)
+                logger.info(f"  ✅ [{keyword}] {log_label}에서 {len(results)}건 수집")
+                successful_searches += 1
+            else:
+                logger.info(f"  ⚪ [{keyword}] {log_label} 검색 결과 없음")
+
+    def _get_retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """API 재시도 대기 시간 (G2B 백오프 설정 적용)"""
+        return get_retry_delay(attempt, self.api_retry_backoff, self.api_retry_max_delay, retry_after)
+
     def _get_prioritized_api_base_urls(self) -> List[str]:
         """최근 성공한 엔드포인트를 우선적으로 시도"""
         if self.active_api_base_url and self.active_api_base_url in self.api_base_url_candidates:
@@ -179,58 +515,89 @@ class G2BCrawler(BaseCrawler):
 
     async def _request_bid_public_info(
         self,
+        context: _SearchContext,
         session: aiohttp.ClientSession,
         operation: str,
-        params: Dict[str, Any],
+        query: str,
         category_label: str,
-    ) -> Optional[str]:
-        """엔드포인트 후보를 순회하며 BidPublicInfoService 응답을 가져온다."""
+    ) -> Optional[bytes]:
+        """엔드포인트 후보를 순회하며 BidPublicInfoService 응답 본문(bytes)을 가져온다.
+
+        query는 이미 인코딩된 쿼리 문자열이며 aiohttp가 다시 인코딩하지 않도록 그대로 전달한다.
+        """
 
         last_status: Optional[int] = None
         service_unavailable_count = 0
 
         for base_url in self._get_prioritized_api_base_urls():
-            url = f"{base_url}/{operation}"
-            try:
-                async with session.get(url, params=params) as response:
-                    last_status = response.status
+            url = self._operation_urls.get((base_url, operation)) or f"{base_url}/{operation}"
 
-                    if response.status == 200:
-                        if base_url != self.active_api_base_url:
-                            logger.info(f"[{category_label}] G2B API 엔드포인트 사용: {base_url}")
-                        self.active_api_base_url = base_url
-                        return await response.text()
+            for attempt in range(self.api_max_retries + 1):
+                retry_delay: Optional[float] = None
+                try:
+                    request_url = URL(f"{url}?{query}", encoded=True)
+                    async with self._request_slot(context), session.get(request_url) as response:
+                        last_status = response.status
+
+                        if response.status == 200:
+                            if base_url != self.active_api_base_url:
+                                logger.info(f"[{category_label}] G2B API 엔드포인트 사용: {base_url}")
+                            self.active_api_base_url = base_url
+                            return await response.read()
+
+                        # 일시적 오류(429/5xx)는 같은 엔드포인트에 백오프 후 재시도
+                        if response.status in RETRYABLE_STATUSES and attempt < self.api_max_retries:
+                            retry_delay = self._get_retry_delay(attempt, response.headers.get("Retry-After"))
+                            logger.warning(
+                                f"[{category_label}] 엔드포인트 {url} 에서 {response.status} 응답 - "
+                                f"{retry_delay:.1f}초 후 재시도 ({attempt + 1}/{self.api_max_retries})"
+                            )
 
-                    if response.status == 404:
-                        logger.warning(
-                            f"[{category_label}] 엔드포인트 {url} 에서 404 응답 - 다른 경로 시도"
-                        )
-                        if self.active_api_base_url == base_url:
-                            self.active_api_base_url = None
-                        continue
+                        elif response.status == 404:
+                            logger.warning(
+                                f"[{category_label}] 엔드포인트 {url} 에서 404 응답 - 다른 경로 시도"
+                            )
+                            if self.active_api_base_url == base_url:
+                                self.active_api_base_url = None
 
-                    if response.status == 503:
-                        service_unavailable_count += 1
+                        elif response.status == 503:
+                            service_unavailable_count += 1
+                            logger.warning(
+                                f"[{category_label}] 엔드포인트 {url} 에서 503 서비스 불가 응답 - 다른 경로 시도"
+                            )
+                            if self.active_api_base_url == base_url:
+                                self.active_api_base_url = None
+
+                        else:
+                            error_text = await response.text()
+                            logger.error(
+                                f"[{category_label}] API 호출 실패: {response.status}"
+                            )
+                            if error_text:
+                                logger.debug(f"[{category_label}] API 실패 응답: {error_text[:200]}")
+                            return None
+
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if attempt < self.api_max_retries:
+                        retry_delay = self._get_retry_delay(attempt)
                         logger.warning(
-                            f"[{category_label}] 엔드포인트 {url} 에서 503 서비스 불가 응답 - 다른 경로 시도"
+                            f"[{category_label}] API 연결 오류 ({url}): {e} - "
+                            f"{retry_delay:.1f}초 후 재시도 ({attempt + 1}/{self.api_max_retries})"
                         )
+                    else:
+                        logger.error(f"[{category_label}] API 호출 중 예외 발생 ({url}): {e}")
                         if self.active_api_base_url == base_url:
                             self.active_api_base_url = None
-                        continue
 
-                    error_text = await response.text()
-                    logger.error(
-                        f"[{category_label}] API 호출 실패: {response.status}"
-                    )
-                    if error_text:
-                        logger.debug(f"[{category_label}] API 실패 응답: {error_text[:200]}")
-                    return None
+                except Exception as e:
+                    logger.error(f"[{category_label}] API 호출 중 예외 발생 ({url}): {e}")
+                    if self.active_api_base_url == base_url:
+                        self.active_api_base_url = None
 
-            except Exception as e:
-                logger.error(f"[{category_label}] API 호출 중 예외 발생 ({url}): {e}")
-                if self.active_api_base_url == base_url:
-                    self.active_api_base_url = None
-                continue
+                if retry_delay is None:
+                    # 재시도 대상이 아니면 다음 엔드포인트로
+                    break
+                await asyncio.sleep(retry_delay)
 
         # 서비스 상태에 따른 적절한 에러 메시지 출력
         if service_unavailable_count == len(self.api_base_url_candidates):
@@ -248,9 +615,12 @@ class G2BCrawler(BaseCrawler):
         category: str,
         keywords: List[str],
         display_name: Optional[str] = None,
+        context: Optional[_SearchContext] = None,
     ) -> List[Dict[str, Any]]:
-        """BidPublicInfoService API 검색"""
+        """BidPublicInfoService API 검색 (context가 없으면 이 호출만의 검색 상태 생성)"""
         results: List[Dict[str, Any]] = []
+        if context is None:
+            context = self._new_search_context()
 
         try:
             category_label = display_name or category
@@ -258,81 +628,142 @@ class G2BCrawler(BaseCrawler):
                 logger.warning("유효한 G2B API 키가 없어 BidPublicInfoService 호출을 건너뜁니다.")
                 return results
 
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)  # 30일로 단축하여 API 제한 회피
+            start_date, end_date = context.search_window
 
             base_params = {
-                "ServiceKey": self.encoded_api_key,
-                "type": "json",
-                "numOfRows": self.api_rows_per_page,
+                **self._base_request_params,
                 "inqryDiv": "1",  # 등록일시 기준
                 "inqryBgnDt": start_date.strftime("%Y%m%d0000"),  # 시간을 0000으로 고정
                 "inqryEndDt": end_date.strftime("%Y%m%d2359"),    # 시간을 2359로 고정
             }
             search_params = self._build_search_query_params(category, keywords, start_date, end_date)
 
-            timeout = self.api_request_timeout
-
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                page_no = 1
-                total_count: Optional[int] = None
-
-                while True:
-                    request_params = {**base_params, **search_params, "pageNo": page_no}
-                    json_data: Optional[Dict[str, Any]] = None
-                    should_break = False
-
-                    data = await self._request_bid_public_info(
-                        session, operation, request_params, category_label
-                    )
-
-                    if data is None:
-                        should_break = True
-                    else:
-                        if not data.strip():
-                            logger.warning(
-                                f"[{category_label}] API에서 빈 응답 수신 (page {page_no})"
-                            )
-                            should_break = True
-                        else:
-                            try:
-                                json_data = json.loads(data)
-                            except json.JSONDecodeError:
-                                logger.error(
-                                    f"[{category_label}] API 응답을 JSON으로 파싱하지 못했습니다. 응답 내용: {data[:200]}"
+            # pageNo를 제외한 쿼리는 카테고리당 한 번만 인코딩
+            query_prefix = self._encode_query_params({**base_params, **search_params})
+
+            async with self._api_session(context) as session:
+                # 1페이지에서 전체 건수를 확인한 뒤 나머지 페이지는 동시에 요청
+                json_data = await self._fetch_page_json(
+                    context, session, operation, query_prefix, 1, category_label
+                )
+                if json_data is None:
+                    return results
+
+                page_results = await self._parse_api_response(
+                    json_data, category, keywords, display_name=display_name, context=context
+                )
+                results.extend(page_results)
+                total_count = self._extract_total_count(json_data)
+                json_data = None
+
+                if total_count is not None:
+                    last_page = -(-total_count // self.api_rows_per_page)
+                    if last_page > self.api_max_pages:
+                        # 비정상적으로 큰 totalCount로 수천 개의 페이지 요청이 한 번에 생기지 않도록 제한
+                        logger.warning(
+                            f"[{category_label}] 전체 {total_count}건({last_page}페이지) 중 "
+                            f"{self.api_max_pages}페이지까지만 조회합니다"
+                        )
+                        last_page = self.api_max_pages
+                    if last_page > 1:
+                        page_batches = await asyncio.gather(
+                            *[
+                                self._fetch_and_parse_page(
+                                    context, session, operation, query_prefix, page_no,
+                                    category, keywords, display_name,
                                 )
-                                should_break = True
-
-                    if should_break:
-                        break
+                                for page_no in range(2, last_page + 1)
+                            ],
+                            return_exceptions=True,
+                        )
+                        for page_no, page_batch in enumerate(page_batches, 2):
+                            if isinstance(page_batch, Exception):
+                                logger.warning(f"[{category_label}] page {page_no} 처리 실패: {page_batch}")
+                                continue
+                            results.extend(page_batch)
+                    return results
 
-                    if json_data is None:
+                # 전체 건수를 알 수 없으면 빈 페이지가 나올 때까지 순차 순회
+                page_no = 1
+                while page_results:
+                    if page_no >= self.api_max_pages:
+                        logger.warning(f"[{category_label}] {self.api_max_pages}페이지까지만 조회합니다")
                         break
-
-                    page_results = await self._parse_api_response(
-                        json_data, category, keywords, display_name=display_name
+                    page_no += 1
+                    page_results = await self._fetch_and_parse_page(
+                        context, session, operation, query_prefix, page_no,
+                        category, keywords, display_name,
                     )
-                    if page_results:
-                        results.extend(page_results)
-
-                    if total_count is None:
-                        total_count = self._extract_total_count(json_data)
-
-                    if not page_results:
-                        logger.info(f"[{category_label}] 더 이상 결과가 없어 페이지 순회를 종료합니다.")
-                        break
+                    results.extend(page_results)
 
-                    if total_count is not None and page_no * self.api_rows_per_page >= total_count:
-                        break
-
-                    page_no += 1
-                    await asyncio.sleep(1 / self.api_rate_limit_tps)
+                logger.info(f"[{category_label}] 더 이상 결과가 없어 페이지 순회를 종료합니다.")
 
         except Exception as e:
             logger.error(f"카테고리 '{category}' API 검색 중 오류: {e}")
 
         return results
 
+    async def _fetch_page_json(
+        self,
+        context: _SearchContext,
+        session: aiohttp.ClientSession,
+        operation: str,
+        query_prefix: str,
+        page_no: int,
+        category_label: str,
+    ) -> Optional[Dict[str, Any]]:
+        """단일 페이지 요청 및 JSON 변환 (실패/빈 응답이면 None)"""
+        data = await self._request_bid_public_info(
+            context, session, operation, f"{query_prefix}&pageNo={page_no}", category_label
+        )
+        if data is None:
+            return None
+
+        if not data or data.isspace():
+            logger.warning(f"[{category_label}] API에서 빈 응답 수신 (page {page_no})")
+            return None
+
+        try:
+            return await self._decode_json(data)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            logger.error(
+                f"[{category_label}] API 응답을 JSON으로 파싱하지 못했습니다. "
+                f"응답 내용: {_preview_bytes(data, 200)}"
+            )
+            return None
+
+    async def _fetch_and_parse_page(
+        self,
+        context: _SearchContext,
+        session: aiohttp.ClientSession,
+        operation: str,
+        query_prefix: str,
+        page_no: int,
+        category: str,
+        keywords: List[str],
+        display_name: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """페이지를 받아 바로 파싱 (동시 요청 시 페이지 JSON을 모아두지 않음)"""
+        json_data = await self._fetch_page_json(
+            context, session, operation, query_prefix, page_no, display_name or category
+        )
+        if json_data is None:
+            return []
+        return await self._parse_api_response(
+            json_data, category, keywords, display_name=display_name, context=context
+        )
+
+    def _encode_query_params(self, params: Dict[str, Any]) -> str:
+        """요청 파라미터를 쿼리 문자열로 인코딩 (ServiceKey는 인코딩된 키를 그대로 사용)"""
+        service_key = params.get("ServiceKey")
+        query = urlencode(
+            {key: value for key, value in params.items() if key != "ServiceKey"},
+            quote_via=quote,
+        )
+        if not service_key:
+            return query
+        return f"ServiceKey={service_key}&{query}" if query else f"ServiceKey={service_key}"
+
     def _build_search_query_params(
         self,
         category: str,
@@ -396,23 +827,24 @@ class G2BCrawler(BaseCrawler):
 
         return params
 
-    async def _search_standard_api(self, keywords: List[str]) -> List[Dict[str, Any]]:
+    async def _search_standard_api(
+        self, keywords: List[str], context: Optional[_SearchContext] = None
+    ) -> List[Dict[str, Any]]:
         """공공데이터개방표준서비스 API 검색 (키워드 기반)"""
         results: List[Dict[str, Any]] = []
+        if context is None:
+            context = self._new_search_context()
 
         try:
             if not self.encoded_api_key:
                 logger.warning("유효한 G2B API 키가 없어 표준 API 호출을 건너뜁니다.")
                 return results
 
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)  # 30일로 단축하여 API 제한 회피
+            start_date, end_date = context.search_window
 
             # 기본 매개변수
             base_params = {
-                "ServiceKey": self.encoded_api_key,
-                "type": "json",
-                "numOfRows": self.api_rows_per_page,
+                **self._base_request_params,
                 "pageNo": 1,
                 "bidNtceBgnDt": start_date.strftime("%Y%m%d0000"),
                 "bidNtceEndDt": end_date.strftime("%Y%m%d2359"),
@@ -440,24 +872,24 @@ class G2BCrawler(BaseCrawler):
 
             logger.info(f"🔍 표준 API 검색 - 기간: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
 
-            async with aiohttp.ClientSession(timeout=self.api_request_timeout) as session:
-                url = f"{self.standard_api_base_url}/{self.standard_operation}"
-
-                async with session.get(url, params=params) as response:
+            async with self._api_session(context) as session:
+                async with self._request_slot(context), session.get(self.standard_api_url, params=params) as response:
                     if response.status != 200:
                         logger.error(f"표준 API 호출 실패: {response.status}")
                         return results
 
-                    data = await response.text()
-                    logger.info(f"표준 API 응답 내용 (처음 300자): {data[:300]}")
+                    data = await response.read()
+                    logger.info(f"표준 API 응답 내용 (처음 300바이트): {_preview_bytes(data, 300)}")
 
-                    if not data.strip():
+                    if not data or data.isspace():
                         logger.warning("표준 API에서 빈 응답 수신")
                         return results
 
-                    if data.strip().startswith('<OpenAPI_ServiceResponse>'):
+                    # JSON 응답 본문 전체를 훑지 않도록 앞부분만 보고 XML 오류 응답 여부 판단
+                    head = _response_head(data)
+                    if head.startswith(XML_ERROR_PREFIXES):
                         logger.error("G2B 표준 API 인증 오류 - XML 오류 응답 수신")
-                        if 'SERVICE_ACCESS_DENIED_ERROR' in data and self.api_key:
+                        if b'SERVICE_ACCESS_DENIED_ERROR' in data and self.api_key:
                             masked_key = self._mask_api_key(self.api_key)
                             logger.error("🚫 G2B API 키 인증 실패 (오류코드: 20)")
                             logger.error("📋 해결 방법:")
@@ -465,21 +897,21 @@ class G2BCrawler(BaseCrawler):
                             logger.error("   2. '나라장터 공공데이터개방표준서비스' 검색 및 활용신청")
                             logger.error("   3. 승인된 API 키를 .env 파일의 G2B_API_KEY에 설정")
                             logger.error(f"   4. 현재 설정된 키: {masked_key}")
-                        logger.error(f"📄 전체 오류 응답: {data}")
+                        logger.error(f"📄 오류 응답 (최대 1KB): {_preview_bytes(data, ERROR_LOG_BYTES)}")
                         return results
 
                     try:
-                        json_data = json.loads(data)
+                        json_data = await self._decode_json(data)
                         logger.info(
                             "표준 API JSON 파싱 성공. 응답 구조: "
                             f"{list(json_data.keys()) if isinstance(json_data, dict) else type(json_data)}"
                         )
-                    except json.JSONDecodeError as e:
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
                         logger.error(f"표준 API JSON 파싱 오류: {e}")
-                        logger.error(f"응답 내용: {data}")
+                        logger.error(f"응답 내용 (최대 1KB): {_preview_bytes(data, ERROR_LOG_BYTES)}")
                         return results
 
-                    results = await self._parse_standard_api_response(json_data, keywords)
+                    results = await self._parse_standard_api_response(json_data, keywords, context)
 
         except Exception as e:
             logger.error(f"표준 API 검색 중 오류: {e}")
@@ -492,10 +924,15 @@ class G2BCrawler(BaseCrawler):
         category: str,
         keywords: List[str],
         display_name: Optional[str] = None,
+        context: Optional[_SearchContext] = None,
     ) -> List[Dict[str, Any]]:
         """BidPublicInfoService API 응답 데이터 파싱"""
         results: List[Dict[str, Any]] = []
+        if context is None:
+            context = self._new_search_context()
         category_label = display_name or category
+        rejected_count = 0
+        duplicate_count = 0
 
         try:
             if 'response' not in json_data:
@@ -527,49 +964,51 @@ class G2BCrawler(BaseCrawler):
                 logger.info(f"카테고리 '{category_label}'에서 검색 결과 없음")
                 return results
 
-            # 실제 반환된 데이터 확인을 위한 로그
+            items = self._normalize_items(items)
+            query_matcher = self._get_query_matcher(keywords)
+            crawled_at = context.crawled_at
+            seen_bid_keys = context.seen_bid_keys
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+            # 실제 반환된 데이터 확인을 위한 로그 (페이지당 1회, 샘플은 DEBUG에서만)
             logger.info(f"📋 {category_label} - API에서 {len(items)}건의 입찰 데이터 반환")
-            if len(items) > 0:
+            if debug_enabled and items:
                 first_item = items[0]
-                logger.info(f"📄 첫 번째 아이템 샘플: {first_item.get('bidNtceNm', first_item.get('ntceNm', '제목없음'))}")
-
-            items = self._normalize_items(items)
+                logger.debug(f"📄 첫 번째 아이템 샘플: {first_item.get('bidNtceNm', first_item.get('ntceNm', '제목없음'))}")
 
             for item in items:
                 try:
-                    title = self._get_first_non_empty(item, ['bidNtceNm', 'ntceNm', 'bidNm'])
-                    organization = self._get_first_non_empty(item, ['ntceInsttNm', 'dminsttNm', 'insttNm'])
+                    bid_number = item.get('bidNtceNo', '')
+                    bid_notice_order = item.get('bidNtceOrd', '')
+                    bid_key = (bid_number, bid_notice_order)
+
+                    # 같은 검색에서 이미 수집한 공고는 점수 계산/변환 없이 건너뜀
+                    if bid_number and bid_key in seen_bid_keys:
+                        duplicate_count += 1
+                        continue
+
+                    title = self._get_first_non_empty(item, TITLE_KEYS)
+                    organization = self._get_first_non_empty(item, ORGANIZATION_KEYS)
 
                     # 키워드 관련성 확인
-                    if not self._is_keyword_relevant(title, organization, keywords):
+                    matched_keywords = self._match_item_keywords(title, organization, query_matcher)
+                    if matched_keywords is None:
+                        rejected_count += 1
                         continue
 
-                    deadline_date = self._get_first_non_empty(item, ['bidClseDt', 'bidClseDt1', 'bidClseDt2'])
-                    estimated_price_raw = self._get_first_non_empty(
-                        item, ['presmptPrce', 'asignBdgtAmt', 'bdgtAmt', 'refAmt']
-                    )
+                    fields = self._extract_fields(item, DETAIL_FIELD_KEYS)
+                    deadline_date = fields['deadline_date']
+                    estimated_price = self._format_price(fields['estimated_price'])
 
-                    logger.info(f"📝 [{category_label}] {title[:80]}")
-                    logger.info(f"    🏢 발주기관: {organization}")
-                    logger.info(f"    💰 추정가격: {self._format_price(estimated_price_raw)}")
-                    logger.info(f"    📅 마감일: {deadline_date}")
+                    if debug_enabled:
+                        logger.debug(
+                            f"📝 [{category_label}] {title[:80]} | 🏢 {organization} | 💰 {estimated_price} | 📅 {deadline_date}"
+                        )
 
                     relevance_score = self.calculate_relevance_score(title, organization)
                     urgency_level = self.determine_urgency_level(deadline_date)
 
-                    bid_number = item.get('bidNtceNo', '')
-                    bid_notice_order = item.get('bidNtceOrd', '')
-                    announcement_date_raw = self._get_first_non_empty(
-                        item, ['bidNtceDt', 'rgstDt', 'ntceDt']
-                    )
-                    estimated_price_raw = self._get_first_non_empty(
-                        item, ['presmptPrce', 'asignBdgtAmt', 'bdgtAmt', 'refAmt']
-                    )
-                    budget_amount_raw = self._get_first_non_empty(
-                        item, ['asignBdgtAmt', 'bdgtAmt', 'presmptPrce']
-                    )
-
-                    detail_url = self._get_first_non_empty(item, ['bidNtceDtlUrl', 'bidNtceUrl']) or self._generate_detail_url(
+                    detail_url = fields['detail_url'] or self._generate_detail_url(
                         bid_number,
                         bid_notice_order
                     )
@@ -578,36 +1017,34 @@ class G2BCrawler(BaseCrawler):
                         "title": title,
                         "organization": organization,
                         "bid_number": bid_number,
-                        "announcement_date": self._format_date(announcement_date_raw),
+                        "announcement_date": self._format_date(fields['announcement_date']),
                         "deadline_date": self._format_date(deadline_date),
-                        "estimated_price": self._format_price(estimated_price_raw),
+                        "estimated_price": estimated_price,
                         "currency": "KRW",
                         "source_url": detail_url,
                         "source_site": "G2B",
                         "country": "KR",
-                        "keywords": self._extract_keywords(title, organization),
+                        "keywords": matched_keywords,
                         "relevance_score": relevance_score,
                         "urgency_level": urgency_level,
                         "status": "active",
                         "extra_data": {
-                            "crawled_at": datetime.now().isoformat(),
+                            "crawled_at": crawled_at,
                             "category": category,
                             "category_label": category_label,
                             "bid_method": item.get('bidMethdNm', ''),
-                            "contract_method": self._get_first_non_empty(
-                                item, ['cntrctCnclsMthdNm', 'cntrctMthdNm']
-                            ),
-                            "bid_qualification": self._get_first_non_empty(item, ['bidQlfctNm', 'bidPrtcptQlfctNm']),
-                            "opening_date": self._format_date(self._get_first_non_empty(item, ['opengDt', 'bidOpenDt'])),
-                            "opening_place": self._get_first_non_empty(item, ['opengPlce', 'bidOpenPlce']),
-                            "contact_name": self._get_first_non_empty(item, ['ofclNm', 'chrgePerNm']),
-                            "contact_phone": self._get_first_non_empty(item, ['ofclTelNo', 'chrgePerTel']),
-                            "contact_email": self._get_first_non_empty(item, ['ofclEmail', 'chrgePerEmail']),
-                            "reference_number": self._get_first_non_empty(item, ['refNo', 'bidNtceRefNo']),
-                            "notice_division": self._get_first_non_empty(item, ['ntceDivNm', 'ntceKindNm']),
-                            "vat_included": self._get_first_non_empty(item, ['vatInclsnYnNm', 'vatYnNm']),
-                            "budget_amount": self._format_price(budget_amount_raw),
-                            "region_limit": self._get_first_non_empty(item, ['rgnLmtDivNm', 'bidAreaLmtYnNm']),
+                            "contract_method": fields['contract_method'],
+                            "bid_qualification": fields['bid_qualification'],
+                            "opening_date": self._format_date(fields['opening_date']),
+                            "opening_place": fields['opening_place'],
+                            "contact_name": fields['contact_name'],
+                            "contact_phone": fields['contact_phone'],
+                            "contact_email": fields['contact_email'],
+                            "reference_number": fields['reference_number'],
+                            "notice_division": fields['notice_division'],
+                            "vat_included": fields['vat_included'],
+                            "budget_amount": self._format_price(fields['budget_amount']),
+                            "region_limit": fields['region_limit'],
                             "bid_notice_order": bid_notice_order,
                             "api_data": True,
                             "api_service": "BidPublicInfoService"
@@ -615,6 +1052,8 @@ class G2BCrawler(BaseCrawler):
                     }
 
                     results.append(bid_info)
+                    if bid_number:
+                        seen_bid_keys.add(bid_key)
 
                 except Exception as e:
                     logger.warning(f"[{category_label}] 개별 아이템 파싱 중 오류: {e}")
@@ -624,15 +1063,28 @@ class G2BCrawler(BaseCrawler):
             logger.error(f"[{category_label}] API 응답 파싱 중 오류: {e}")
 
         if results:
-            logger.info(f"✅ [{category_label}] 수집 완료: {len(results)}건")
+            logger.info(
+                f"✅ [{category_label}] 수집 완료: {len(results)}건 "
+                f"(키워드 불일치 제외 {rejected_count}건, 중복 제외 {duplicate_count}건)"
+            )
+        elif duplicate_count:
+            logger.info(f"⚪ [{category_label}] 신규 결과 없음 (중복 제외 {duplicate_count}건)")
         else:
             logger.info(f"❌ [{category_label}] 수집 결과 없음")
 
         return results
 
-    async def _parse_standard_api_response(self, json_data: Dict[str, Any], keywords: List[str]) -> List[Dict[str, Any]]:
+    async def _parse_standard_api_response(
+        self,
+        json_data: Dict[str, Any],
+        keywords: List[str],
+        context: Optional[_SearchContext] = None,
+    ) -> List[Dict[str, Any]]:
         """공공데이터개방표준서비스 API 응답 데이터 파싱"""
         results: List[Dict[str, Any]] = []
+        if context is None:
+            context = self._new_search_context()
+        rejected_count = 0
 
         try:
             if 'response' not in json_data:
@@ -662,18 +1114,22 @@ class G2BCrawler(BaseCrawler):
             total_count = body.get('totalCount', 0)
 
             logger.info(f"📊 표준 API 전체 결과 수: {total_count}건")
-            logger.info(f"🔍 items 타입: {type(items)}, 길이: {len(items) if isinstance(items, list) else 'N/A'}")
 
-            # 응답 구조 디버깅
-            if items and isinstance(items, list) and len(items) > 0:
-                logger.info(f"📄 첫 번째 아이템 샘플 키들: {list(items[0].keys())}")
-                logger.info(f"📄 첫 번째 아이템 전체: {items[0]}")
+            # 응답 구조 디버깅 (아이템 전체 출력은 DEBUG에서만)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🔍 items 타입: {type(items)}, 길이: {len(items) if isinstance(items, list) else 'N/A'}")
+                if items and isinstance(items, list):
+                    logger.debug(f"📄 첫 번째 아이템 샘플 키들: {list(items[0].keys())}")
+                    logger.debug(f"📄 첫 번째 아이템 전체: {items[0]}")
 
             if not items:
                 logger.info("표준 API 검색 결과 없음")
                 return results
 
             items = self._normalize_items(items)
+            query_matcher = self._get_query_matcher(keywords)
+            crawled_at = context.crawled_at
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
             for idx, item in enumerate(items):
                 try:
@@ -683,16 +1139,18 @@ class G2BCrawler(BaseCrawler):
                     # logger.info(f"📋 표준 API 입찰제목: {title}")  # 중복 로그 제거
 
                     # 키워드 관련성 확인
-                    if not self._is_keyword_relevant(title, organization, keywords):
+                    matched_keywords = self._match_item_keywords(title, organization, query_matcher)
+                    if matched_keywords is None:
+                        rejected_count += 1
                         continue
 
                     deadline_date = item.get('bidClseDate', '')
-                    estimated_price = item.get('presmptPrce', '')
+                    estimated_price = self._format_price(item.get('presmptPrce', ''))
 
-                    logger.info(f"📝 [{idx+1}] {title[:80]}")
-                    logger.info(f"    🏢 발주기관: {organization}")
-                    logger.info(f"    💰 추정가격: {self._format_price(estimated_price)}")
-                    logger.info(f"    📅 마감일: {deadline_date}")
+                    if debug_enabled:
+                        logger.debug(
+                            f"📝 [{idx+1}] {title[:80]} | 🏢 {organization} | 💰 {estimated_price} | 📅 {deadline_date}"
+                        )
 
                     relevance_score = self.calculate_relevance_score(title, organization)
                     urgency_level = self.determine_urgency_level(deadline_date)
@@ -706,17 +1164,17 @@ class G2BCrawler(BaseCrawler):
                         "bid_number": bid_number,
                         "announcement_date": self._format_date(item.get('nticeDt', '')),
                         "deadline_date": self._format_date(deadline_date),
-                        "estimated_price": self._format_price(item.get('presmptPrce', '')),
+                        "estimated_price": estimated_price,
                         "currency": "KRW",
                         "source_url": item.get('bidNtceUrl', ''),
                         "source_site": "G2B",
                         "country": "KR",
-                        "keywords": self._extract_keywords(title, organization),
+                        "keywords": matched_keywords,
                         "relevance_score": relevance_score,
                         "urgency_level": urgency_level,
                         "status": "active",
                         "extra_data": {
-                            "crawled_at": datetime.now().isoformat(),
+                            "crawled_at": crawled_at,
                             "bid_notice_order": bid_notice_order,
                             "business_division": item.get('bsnsDivNm', ''),
                             "contract_method": item.get('cntrctCnclsMthdNm', ''),
@@ -747,12 +1205,17 @@ class G2BCrawler(BaseCrawler):
             logger.error(f"표준 API 응답 파싱 중 오류: {e}")
 
         if results:
-            logger.info(f"✅ [표준 API] 수집 완료: {len(results)}건")
+            logger.info(f"✅ [표준 API] 수집 완료: {len(results)}건 (키워드 불일치 제외 {rejected_count}건)")
         else:
             logger.info(f"❌ [표준 API] 수집 결과 없음")
 
         return results
 
+    async def _decode_json(self, data: bytes) -> Any:
+        """JSON 디코딩을 스레드 풀에서 수행해 다른 카테고리 요청이 멈추지 않도록 한다"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _json_loads, data)
+
     def _extract_total_count(self, json_data: Dict[str, Any]) -> Optional[int]:
         """응답에서 totalCount 값을 안전하게 추출"""
         try:
@@ -764,46 +1227,34 @@ class G2BCrawler(BaseCrawler):
         except (ValueError, TypeError, AttributeError):
             return None
 
-    def _matches_keywords(self, title: str, organization: str, keywords: List[str]) -> bool:
-        """키워드 매칭 확인"""
-        from src.config import crawler_config
-
-        text = f"{title} {organization}".lower()
-
-        all_keywords: List[str] = []
-        all_keywords.extend(crawler_config.SEEGENE_KEYWORDS['korean'])
-        all_keywords.extend(crawler_config.SEEGENE_KEYWORDS['english'])
-
-        for keyword in all_keywords:
-            if keyword.lower() in text:
-                return True
-
-        for keyword in keywords:
-            if keyword.lower() in text:
-                return True
+    def _prepare_keyword_cache(self) -> None:
+        """Seegene 키워드 매처를 미리 구성"""
+        self._seegene_matcher = build_keyword_matcher(
+            tuple(crawler_config.SEEGENE_KEYWORDS['korean']) + tuple(crawler_config.SEEGENE_KEYWORDS['english'])
+        )
 
-        return False
+    def _get_query_matcher(self, keywords: List[str]) -> KeywordMatcher:
+        """검색 키워드 매처 (같은 키워드 조합은 캐시된 오토마톤 재사용)"""
+        return build_keyword_matcher(tuple(keywords))
 
-    async def _check_api_service_availability(self) -> bool:
+    async def _check_api_service_availability(self, context: Optional[_SearchContext] = None) -> bool:
         """G2B API 서비스 가용성 체크"""
-        try:
-            import aiohttp
+        if context is None:
+            context = self._new_search_context()
 
-            # 기본 API 서비스 상태 확인
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                for base_url in self.api_base_url_candidates[:2]:  # 처음 2개만 체크
-                    try:
-                        # 간단한 헬스체크를 위해 기본 URL만 요청
-                        async with session.get(base_url) as response:
-                            if response.status in [200, 404]:  # 404도 서비스가 살아있다는 의미
-                                logger.info(f"G2B API 서비스 가용성 확인: {base_url} (상태: {response.status})")
-                                return True
-                            elif response.status == 503:
-                                logger.warning(f"G2B API 서비스 불가: {base_url} (503 Service Unavailable)")
-                                continue
-                    except Exception as e:
-                        logger.debug(f"G2B API 가용성 체크 실패: {base_url} - {e}")
-                        continue
+        try:
+            # 기본 API 서비스 상태 확인 (처음 2개 엔드포인트를 동시에 확인)
+            health_timeout = aiohttp.ClientTimeout(total=10)
+            async with self._api_session(context) as session:
+                probes = await asyncio.gather(
+                    *[
+                        self._probe_api_endpoint(session, base_url, health_timeout)
+                        for base_url in self.api_base_url_candidates[:2]
+                    ]
+                )
+
+            if any(probes):
+                return True
 
             logger.warning("모든 G2B API 엔드포인트가 응답하지 않습니다")
             return False
@@ -812,20 +1263,24 @@ class G2BCrawler(BaseCrawler):
             logger.error(f"G2B API 서비스 가용성 체크 중 오류: {e}")
             return False
 
-    def _extract_keywords(self, title: str, organization: str = "") -> List[str]:
-        """제목과 기관명에서 키워드 추출"""
-        keywords: List[str] = []
-        text_lower = f"{title} {organization}".lower()
-
-        from src.config import crawler_config
-        for keyword in crawler_config.SEEGENE_KEYWORDS['korean']:
-            if keyword.lower() in text_lower:
-                keywords.append(keyword)
-        for keyword in crawler_config.SEEGENE_KEYWORDS['english']:
-            if keyword.lower() in text_lower:
-                keywords.append(keyword)
-
-        return list(set(keywords))
+    async def _probe_api_endpoint(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str,
+        timeout: aiohttp.ClientTimeout,
+    ) -> bool:
+        """단일 엔드포인트 헬스체크"""
+        try:
+            # 간단한 헬스체크를 위해 기본 URL만 요청
+            async with session.get(base_url, timeout=timeout) as response:
+                if response.status in [200, 404]:  # 404도 서비스가 살아있다는 의미
+                    logger.info(f"G2B API 서비스 가용성 확인: {base_url} (상태: {response.status})")
+                    return True
+                if response.status == 503:
+                    logger.warning(f"G2B API 서비스 불가: {base_url} (503 Service Unavailable)")
+        except Exception as e:
+            logger.debug(f"G2B API 가용성 체크 실패: {base_url} - {e}")
+        return False
 
     def _normalize_items(self, items: Any) -> List[Dict[str, Any]]:
         """API 응답 items 구조를 리스트로 정규화"""
@@ -843,68 +1298,61 @@ class G2BCrawler(BaseCrawler):
 
         return []
 
-    def _get_first_non_empty(self, item: Dict[str, Any], keys: List[str]) -> str:
+    def _get_first_non_empty(self, item: Dict[str, Any], keys: Tuple[str, ...]) -> str:
         """주어진 키 목록에서 가장 먼저 등장하는 유효한 값을 반환"""
         for key in keys:
             value = item.get(key)
-            if value is not None and str(value).strip() != "":
-                return value
+            if isinstance(value, str):
+                # 응답 값은 대부분 문자열이므로 str() 변환 없이 공백 여부만 확인
+                if value and not value.isspace():
+                    return value
+            elif value is not None and (text := str(value)).strip():
+                return text
         return ""
 
+    def _extract_fields(
+        self,
+        item: Dict[str, Any],
+        field_keys: Tuple[Tuple[str, Tuple[str, ...]], ...],
+    ) -> Dict[str, str]:
+        """여러 필드의 첫 유효값을 한 번에 추출 (필드마다 메서드를 호출하지 않음)"""
+        fields: Dict[str, str] = {}
+        get = item.get
+        for field, keys in field_keys:
+            text = ""
+            for key in keys:
+                value = get(key)
+                if isinstance(value, str):
+                    if value and not value.isspace():
+                        text = value
+                        break
+                elif value is not None and (converted := str(value)).strip():
+                    text = converted
+                    break
+            fields[field] = text
+        return fields
+
     def _format_date(self, date_str: str) -> str:
         """날짜 형식 변환"""
         if not date_str:
             return ""
 
-        value = str(date_str).strip()
+        value = (date_str if isinstance(date_str, str) else str(date_str)).strip()
         if not value:
             return ""
 
-        date_formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%d",
-            "%Y%m%d%H%M%S",
-            "%Y%m%d%H%M",
-            "%Y%m%d",
-            "%Y/%m/%d",
-            "%Y.%m.%d"
-        ]
-
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(value, fmt)
-                return parsed_date.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-
-        if len(value) >= 10:
-            return value[:10]
-        return value
+        return _normalize_date(value)
 
     def _format_price(self, price_str: str) -> str:
         """가격 형식 변환"""
-        if price_str is None:
+        if price_str is None or price_str == "":
             return ""
 
-        value = str(price_str).strip()
+        value = (price_str if isinstance(price_str, str) else str(price_str)).strip()
         if not value:
             return ""
 
-        normalized = value.replace(",", "")
-
-        try:
-            price_num = float(normalized)
-        except ValueError:
-            filtered = "".join(ch for ch in normalized if ch.isdigit() or ch == '.')
-            if not filtered:
-                return value
-            try:
-                price_num = float(filtered)
-            except ValueError:
-                return value
-
-        return f"{int(price_num):,}원"
+        return _normalize_price(value)
 
     def _generate_detail_url(self, bid_number: str, bid_notice_order: str = "") -> str:
         """상세 페이지 URL 생성"""
@@ -915,9 +1363,35 @@ class G2BCrawler(BaseCrawler):
             return f"{base_url}?bidNo={bid_number}&bidRound={bid_notice_order}"
         return f"{base_url}?bidNo={bid_number}"
 
+    async def _filter_unsaved_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """이미 DB에 저장된 (공고번호, 차수)를 제외 (조회 실패 시 전체 저장)"""
+        bid_numbers = [result.get('bid_number', '') for result in results]
+        if not any(bid_numbers):
+            return results
+
+        try:
+            existing_keys = await DatabaseManager.get_existing_bid_keys("G2B", bid_numbers)
+        except Exception as e:
+            logger.warning(f"G2B 기존 저장 공고 조회 실패 - 전체 저장: {e}")
+            return results
+
+        if not existing_keys:
+            return results
+
+        new_results: List[Dict[str, Any]] = []
+        for result in results:
+            bid_number = result.get('bid_number', '')
+            extra_data = result.get('extra_data')
+            bid_notice_order = extra_data.get('bid_notice_order', '') if isinstance(extra_data, dict) else ''
+            if bid_number and (bid_number, bid_notice_order) in existing_keys:
+                continue
+            new_results.append(result)
+        return new_results
+
     def _remove_duplicates(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """중복 제거"""
         seen_bid_keys = set()
+        seen_urls = set()
         unique_results: List[Dict[str, Any]] = []
 
         for result in results:
@@ -930,10 +1404,13 @@ class G2BCrawler(BaseCrawler):
 
             if bid_number and bid_key not in seen_bid_keys:
                 seen_bid_keys.add(bid_key)
+                seen_urls.add(result.get('source_url', ''))
                 unique_results.append(result)
             elif not bid_number:
-                source_url = result.get('source_url', '')
-                if source_url not in [r.get('source_url', '') for r in unique_results]:
+                # 공고번호가 없으면 URL, URL도 없으면 제목으로 중복 판단 (다른 크롤러와 동일)
+                fallback_key = result.get('source_url', '') or result.get('title', '')
+                if fallback_key and fallback_key not in seen_urls:
+                    seen_urls.add(fallback_key)
                     unique_results.append(result)
 
         return unique_results
@@ -941,16 +1418,14 @@ class G2BCrawler(BaseCrawler):
     def parse_deadline(self, deadline_str: str) -> Optional[datetime]:
         """G2B API 마감일 파싱"""
         try:
-            if not deadline_str or deadline_str.strip() == "":
+            if not deadline_str:
                 return None
 
-            for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d"]:
-                try:
-                    return datetime.strptime(deadline_str.strip(), fmt)
-                except ValueError:
-                    continue
+            value = deadline_str.strip()
+            if not value:
+                return None
 
-            return None
+            return _parse_deadline_value(value)
 
         except Exception:
             return None
@@ -982,24 +1457,24 @@ class G2BCrawler(BaseCrawler):
 
     def _is_keyword_relevant(self, title: str, organization: str, keywords: List[str]) -> bool:
         """키워드와 관련성이 있는지 확인"""
-        if not keywords:
-            return True  # 키워드가 없으면 모든 결과 포함
+        return self._match_item_keywords(title, organization, self._get_query_matcher(keywords)) is not None
 
+    def _match_item_keywords(
+        self,
+        title: str,
+        organization: str,
+        query_matcher: KeywordMatcher,
+    ) -> Optional[List[str]]:
+        """키워드 관련성 판단과 Seegene 키워드 추출을 한 번의 텍스트 순회로 수행
+
+        관련 없는 항목이면 None, 관련 있으면 매칭된 Seegene 키워드 목록을 반환한다.
+        query_matcher는 검색 키워드 매처이며, 검색 키워드가 없으면 모든 항목이 관련 있다.
+        """
         text = f"{title} {organization}".lower()
+        matched = self._seegene_matcher.extract(text)
 
-        # 제공된 키워드 중 하나라도 포함되어 있으면 관련성 있음
-        for keyword in keywords:
-            if keyword.lower() in text:
-                return True
-
-        # Seegene 관련 키워드도 추가로 확인 (더 넓은 범위)
-        from src.config import crawler_config
-        all_seegene_keywords = []
-        all_seegene_keywords.extend(crawler_config.SEEGENE_KEYWORDS['korean'])
-        all_seegene_keywords.extend(crawler_config.SEEGENE_KEYWORDS['english'])
-
-        for seegene_keyword in all_seegene_keywords:
-            if seegene_keyword.lower() in text:
-                return True
+        # 제공된 키워드 또는 Seegene 관련 키워드(더 넓은 범위) 중 하나라도 포함되면 관련성 있음
+        if query_matcher and not matched and not query_matcher.matches(text):
+            return None
 
-        return False
+        return list(matched)
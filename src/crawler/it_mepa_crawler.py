@@ -5,12 +5,28 @@ Italian MEPA 크롤러
 
 import asyncio
 import aiohttp
+import io
 import json
+import re
 import ssl
 import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin, quote
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Set, Tuple, Union
+from urllib.parse import parse_qsl, quote, urlencode, urljoin, urlsplit, urlunsplit
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml이 없는 경우 표준 ElementTree 사용
+    lxml_etree = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:  # selectolax가 없는 경우 정규식 스캔 사용
+        HTMLParser = None
 
 
 def create_ssl_context():
@@ -20,7 +36,10 @@ def create_ssl_context():
     ssl_context.verify_mode = ssl.CERT_NONE
     return ssl_context
 
+from ..config import settings
 from ..utils.logger import get_logger
+from ..utils.keyword_matcher import build_keyword_matcher
+from ..utils.retry import RETRYABLE_STATUSES, get_retry_delay
 from ..crawler.base import BaseCrawler
 from ..models.tender_notice import (
     TenderNotice, TenderStatus, TenderType, ProcurementMethod,
@@ -32,6 +51,243 @@ from ..database.connection import DatabaseManager
 
 logger = get_logger(__name__)
 
+# 검색 결과 페이지의 공고 제목 / 링크 패턴 (대안별 그룹을 하나의 정규식으로 묶어 HTML을 한 번만 스캔)
+SEARCH_TITLE_PATTERN = re.compile(
+    r'<h[2-4][^>]*>([^<]*(?:gara|bando|appalto|procedura)[^<]*)</h[2-4]>'
+    r'|title="([^"]*(?:gara|bando|appalto|procedura)[^"]*)"',
+    re.IGNORECASE
+)
+SEARCH_LINK_PATTERN = re.compile(
+    r'href="([^"]*(?:gara|bando|appalto)[^"]*)"'
+    r'|href="([^"]*procedure[^"]*)"'
+)
+
+# CONSIP 포털 공고 패턴
+CONSIP_TITLE_PATTERN = re.compile(
+    r'<a[^>]*>([^<]*(?:procedura|gara|bando)[^<]*)</a>'
+    r'|<td[^>]*>([^<]*(?:sanitario|medico|ospedaliero)[^<]*)</td>',
+    re.IGNORECASE
+)
+
+# 발주기관명 패턴
+ORGANIZATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(Ministero[^,\n]+)",
+    r"(Regione[^,\n]+)",
+    r"(Comune[^,\n]+)",
+    r"(Provincia[^,\n]+)",
+    r"(Ospedale[^,\n]+)",
+    r"(ASL[^,\n]+)",
+    r"(Università[^,\n]+)",
+    r"(CONSIP[^,\n]*)",
+    r"(Azienda[^,\n]+)",
+))
+
+# 이탈리아 금액 패턴
+VALUE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(\d+(?:\.\d+)*(?:,\d+)?)\s*€",
+    r"€\s*(\d+(?:\.\d+)*(?:,\d+)?)",
+    r"(\d+(?:\.\d+)*(?:,\d+)?)\s*euro",
+    r"importo[:\s]*(\d+(?:\.\d+)*(?:,\d+)?)",
+    r"valore[:\s]*(\d+(?:\.\d+)*(?:,\d+)?)",
+))
+
+# 이탈리아 날짜 패턴 (앞의 패턴이 우선; "scadenza: 01/02/2025" 같은 표기도 첫 패턴에 매칭됨)
+DEADLINE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"(\d{1,2}/\d{1,2}/\d{4})",
+    r"(\d{1,2}-\d{1,2}-\d{4})",
+    r"(\d{4}-\d{1,2}-\d{1,2})",
+))
+
+CPV_PATTERN = re.compile(r"CPV[:\s]*(\d{8})", re.IGNORECASE)
+
+# 의료기기 / 의약품 / 보호장비 CPV 상위 3자리
+HEALTHCARE_CPV_PREFIXES = frozenset({"331", "336", "337"})
+
+# 모든 요청에 붙는 기본 헤더 (RSS/HTML 응답 압축 전송 요청)
+REQUEST_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+# RSS XML 파싱 오류 (lxml 사용 시 XMLSyntaxError 포함)
+RSS_PARSE_ERRORS = (ET.ParseError,) + ((lxml_etree.XMLSyntaxError,) if lxml_etree is not None else ())
+
+# 중복 판단 시 URL에서 제거하는 추적용 쿼리 파라미터
+TRACKING_QUERY_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid"})
+
+# 게시일 형식별 빠른 경로 (RFC 822 / 일/월/년 / ISO)
+# (시각/요일/시간대는 strptime의 %H:%M:%S, %a, %Z/%z가 받는 값만 허용)
+RSS_TIME = r"(?:[01]?\d|2[0-3]):[0-5]?\d:[0-5]?\d"
+RFC822_DATE_PATTERN = re.compile(
+    r"(?i:mon|tue|wed|thu|fri|sat|sun), (\d{1,2}) ([A-Za-z]{3}) (\d{4}) " + RSS_TIME
+    + r" (?:(?i:gmt|utc)|[+-](?:[01]\d|2[0-3])[0-5]\d)"
+)
+DMY_DATE_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})(?: " + RSS_TIME + r")?")
+ISO_DATE_PATTERN = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})(?: " + RSS_TIME + r")?")
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# 빠른 경로에 맞지 않는 날짜 문자열용
+RSS_DATE_FORMATS = (
+    "%a, %d %b %Y %H:%M:%S %Z",
+    "%a, %d %b %Y %H:%M:%S %z",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+# HTML 파서 사용 시 노드 텍스트/속성에 적용하는 필터
+SEARCH_TITLE_TERMS = re.compile(r"gara|bando|appalto|procedura", re.IGNORECASE)
+CONSIP_LINK_TERMS = re.compile(r"procedura|gara|bando", re.IGNORECASE)
+CONSIP_CELL_TERMS = re.compile(r"sanitario|medico|ospedaliero", re.IGNORECASE)
+
+
+def _findall_by_group(pattern: re.Pattern, text: str) -> List[str]:
+    """대안 정규식을 한 번 스캔하고, 매칭을 대안(그룹) 순서대로 모아 반환"""
+    grouped: List[List[str]] = [[] for _ in range(pattern.groups)]
+    for match in pattern.finditer(text):
+        index = match.lastindex
+        if index:
+            grouped[index - 1].append(match.group(index))
+    return [value for values in grouped for value in values]
+
+
+def _node_link(node) -> str:
+    """노드 자신, 하위 또는 상위 <a>의 href (제목과 같은 요소에 묶인 링크)"""
+    href = node.attributes.get("href")
+    if href:
+        return href
+
+    anchor = node.css_first("a[href]")
+    if anchor is not None:
+        return anchor.attributes.get("href") or ""
+
+    parent = node.parent
+    while parent is not None:
+        if parent.tag == "a":
+            return parent.attributes.get("href") or ""
+        parent = parent.parent
+
+    return ""
+
+
+def _scan_search_page(html_content: str) -> List[Tuple[str, str]]:
+    """검색 결과 페이지에서 (공고 제목, 링크) 목록 추출 (HTML 한 번 파싱)"""
+    if HTMLParser is None:
+        # 정규식으로는 제목과 링크의 관계를 알 수 없어 순서대로 짝지음
+        titles = _findall_by_group(SEARCH_TITLE_PATTERN, html_content)
+        links = _findall_by_group(SEARCH_LINK_PATTERN, html_content)
+        return [(title, links[i] if i < len(links) else "") for i, title in enumerate(titles)]
+
+    tree = HTMLParser(html_content)
+
+    entries = [
+        (text, _node_link(node)) for node, text in ((node, node.text()) for node in tree.css("h2, h3, h4"))
+        if SEARCH_TITLE_TERMS.search(text)
+    ]
+    entries.extend(
+        (title, _node_link(node))
+        for node, title in ((node, node.attributes.get("title") or "") for node in tree.css("[title]"))
+        if SEARCH_TITLE_TERMS.search(title)
+    )
+    return entries
+
+
+def _scan_consip_page(html_content: str) -> List[Tuple[str, str]]:
+    """CONSIP 페이지에서 (공고 제목 후보, 링크) 목록 추출 (HTML 한 번 파싱)"""
+    if HTMLParser is None:
+        return [(title, "") for title in _findall_by_group(CONSIP_TITLE_PATTERN, html_content)]
+
+    tree = HTMLParser(html_content)
+
+    entries = [
+        (text, node.attributes.get("href") or "")
+        for node, text in ((node, node.text()) for node in tree.css("a"))
+        if CONSIP_LINK_TERMS.search(text)
+    ]
+    entries.extend(
+        (text, _node_link(node))
+        for node, text in ((node, node.text()) for node in tree.css("td"))
+        if CONSIP_CELL_TERMS.search(text)
+    )
+    return entries
+
+
+def _canonical_url(url: str) -> str:
+    """중복 판단용 URL 정규화 (scheme/host 소문자, 끝 '/'·fragment·추적 파라미터 제거)"""
+    parts = urlsplit(url.strip())
+    query = parts.query
+    if query:
+        query = urlencode([
+            (name, value) for name, value in parse_qsl(query, keep_blank_values=True)
+            if name.lower() not in TRACKING_QUERY_PARAMS and not name.lower().startswith("utm_")
+        ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
+@lru_cache(maxsize=1024)
+def _parse_rss_date(value: str) -> Optional[str]:
+    """게시일 문자열을 ISO 날짜로 변환 (같은 피드의 항목은 게시일이 겹치는 경우가 많아 캐시)"""
+    # 일반적인 형식은 정규식으로 바로 날짜 구성 (strptime 예외 반복 회피)
+    match = RFC822_DATE_PATTERN.fullmatch(value)
+    if match:
+        month = MONTHS.get(match.group(2).lower())
+        if month:
+            try:
+                return date(int(match.group(3)), month, int(match.group(1))).isoformat()
+            except ValueError:
+                pass
+    else:
+        match = DMY_DATE_PATTERN.fullmatch(value)
+        if match:
+            day, month, year = match.groups()
+        else:
+            match = ISO_DATE_PATTERN.fullmatch(value)
+            if match:
+                year, month, day = match.groups()
+        if match:
+            try:
+                return date(int(year), int(month), int(day)).isoformat()
+            except ValueError:
+                pass
+
+    for fmt in RSS_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date().isoformat()
+        except ValueError:
+            continue
+
+    return None
+
+
+def _iter_rss_items(content: Union[str, bytes]) -> Iterator[ET.Element]:
+    """RSS 본문을 스트리밍 파싱해 <item> 요소를 하나씩 반환
+
+    바이트 본문은 XML 선언의 인코딩대로 파서가 직접 디코딩한다.
+    처리가 끝난 item은 비워서 피드 전체 트리를 메모리에 유지하지 않는다.
+    """
+    if lxml_etree is not None:
+        if isinstance(content, bytes):
+            source, encoding = io.BytesIO(content), None
+        else:
+            # 이미 디코딩된 텍스트이므로 XML 선언의 인코딩 대신 UTF-8로 고정
+            source, encoding = io.BytesIO(content.encode("utf-8")), "utf-8"
+        for _, elem in lxml_etree.iterparse(
+            source, events=("end",), tag="item", encoding=encoding, resolve_entities=False
+        ):
+            yield elem
+            # 처리한 item과 앞선 형제 노드를 부모에서 제거해 트리가 커지지 않게 유지
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+
+    source = io.BytesIO(content) if isinstance(content, bytes) else io.StringIO(content)
+    for _, elem in ET.iterparse(source, events=("end",)):
+        if elem.tag == "item":
+            yield elem
+            elem.clear()
+
 
 class ItalyMEPACrawler(BaseCrawler):
     """이탈리아 MEPA (Acquisti in Rete della PA) 크롤러"""
@@ -55,6 +311,24 @@ class ItalyMEPACrawler(BaseCrawler):
             # f"{self.gare_base_url}/opencms/export/sites/publico/bandi/rss/avvisi.xml",
         ]
 
+        # 크롤 단위 커넥션 풀 (모든 수집 단계가 공유, 웹 검색 동시 요청 수와 별개)
+        self.connection_limit = settings.IT_MEPA_POOL_LIMIT
+        self.connection_limit_per_host = settings.IT_MEPA_POOL_LIMIT_PER_HOST
+        self.keepalive_timeout = settings.IT_MEPA_KEEPALIVE_TIMEOUT
+
+        # 웹 검색 동시 요청 수 / 요청 시작 간격 (초) - 같은 호스트에 순차 2초 대기 대신 사용
+        self.web_search_concurrency = 2
+        self.web_search_stagger = 0.3
+
+        # 요청별 타임아웃 (초) / 재시도 횟수 / 재시도 대기 (지수 백오프 기준, 최대값)
+        self.request_timeout = 20
+        self.request_max_retries = 2
+        self.request_retry_backoff = 0.5
+        self.request_retry_max_delay = 10.0
+
+        # 크롤 중 재시도까지 실패한 호스트 (같은 크롤에서 이후 요청은 건너뜀)
+        self._dead_hosts: Set[str] = set()
+
         # 이탈리아어 의료 키워드
         self.medical_keywords_it = [
             "medico", "medica", "sanitario", "ospedale", "clinica",
@@ -62,6 +336,8 @@ class ItalyMEPACrawler(BaseCrawler):
             "dispositivi medici", "farmaceutico", "salute", "cura",
             "terapia", "chirurgia", "radiologia", "cardiologia"
         ]
+        # 의료 키워드 오토마톤 (의료 관련 여부/관련성 점수에서 한 번의 순회로 매칭)
+        self._medical_matcher = build_keyword_matcher(tuple(self.medical_keywords_it))
 
         # 의료기기 관련 CPV 코드
         self.healthcare_cpv_codes = [
@@ -78,20 +354,34 @@ class ItalyMEPACrawler(BaseCrawler):
         logger.info(f"이탈리아 MEPA 크롤링 시작 - 키워드: {keywords}")
 
         results = []
+        self._dead_hosts.clear()
 
         try:
-            # RSS 피드 수집
-            rss_results = await self._crawl_rss_feeds(keywords)
-            results.extend(rss_results)
+            # RSS / 웹 검색 / CONSIP 포털은 서로 독립적이므로 하나의 세션으로 동시에 수집
+            connector = aiohttp.TCPConnector(
+                ssl=create_ssl_context(),
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=45),
+                connector=connector,
+                headers=REQUEST_HEADERS
+            ) as session:
+                phases = [self._crawl_rss_feeds(session, keywords)]
+                if keywords:
+                    phases.append(self._crawl_web_search(session, keywords))
+                phases.append(self._crawl_consip_portal(session, keywords))
 
-            # 웹 검색 크롤링
-            if keywords:
-                web_results = await self._crawl_web_search(keywords)
-                results.extend(web_results)
+                phase_results = await asyncio.gather(*phases, return_exceptions=True)
 
-            # CONSIP 포털 크롤링
-            consip_results = await self._crawl_consip_portal(keywords)
-            results.extend(consip_results)
+            for phase_result in phase_results:
+                if isinstance(phase_result, Exception):
+                    logger.warning(f"이탈리아 MEPA 수집 단계 오류: {phase_result}")
+                    continue
+                results.extend(phase_result)
 
             # 결과 중복 제거
             unique_results = self._remove_duplicates(results)
@@ -126,113 +416,172 @@ class ItalyMEPACrawler(BaseCrawler):
                 "timestamp": datetime.now().isoformat()
             }
 
-    async def _crawl_rss_feeds(self, keywords: List[str] = None) -> List[Dict[str, Any]]:
-        """RSS 피드에서 공고 수집"""
-        results = []
+    def _get_retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """요청 재시도 대기 시간 (IT MEPA 백오프 설정 적용)"""
+        return get_retry_delay(attempt, self.request_retry_backoff, self.request_retry_max_delay, retry_after)
+
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        as_bytes: bool = False,
+    ) -> Optional[Union[str, bytes]]:
+        """GET 요청 (일시적 오류는 백오프 후 재시도, 응답하지 않는 호스트는 이번 크롤에서 제외)
+
+        성공(200) 시 본문을 반환하고, 실패 시 None을 반환한다.
+        """
+        host = urlsplit(url).netloc
+        if host in self._dead_hosts:
+            logger.warning(f"응답하지 않는 호스트로 요청 생략: {url}")
+            return None
+
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+
+        for attempt in range(self.request_max_retries + 1):
+            retry_after = None
+            try:
+                async with session.get(url, params=params, timeout=timeout) as response:
+                    if response.status == 200:
+                        return await response.read() if as_bytes else await response.text()
 
-        if not self.rss_feeds:
-            logger.info("RSS 피드 URL이 설정되지 않음 - 스킵")
-            return results
+                    if response.status not in RETRYABLE_STATUSES:
+                        logger.warning(f"요청 실패 {url}: {response.status}")
+                        return None
 
-        connector = aiohttp.TCPConnector(ssl=create_ssl_context())
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            connector=connector
-        ) as session:
+                    retry_after = response.headers.get("Retry-After")
+                    failure = f"HTTP {response.status}"
 
-            for feed_url in self.rss_feeds:
-                try:
-                    logger.info(f"이탈리아 RSS 피드 크롤링: {feed_url}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                failure = str(e) or type(e).__name__
 
-                    async with session.get(feed_url) as response:
-                        if response.status == 200:
-                            content = await response.text()
-                            feed_results = await self._parse_rss_feed(content, keywords)
-                            results.extend(feed_results)
-                            logger.info(f"RSS에서 {len(feed_results)}건 수집")
-                        else:
-                            logger.warning(f"RSS 피드 접근 실패: {response.status}")
+            if attempt < self.request_max_retries:
+                delay = self._get_retry_delay(attempt, retry_after)
+                logger.warning(
+                    f"요청 재시도 {url} ({failure}) - {delay:.1f}초 후 "
+                    f"({attempt + 1}/{self.request_max_retries})"
+                )
+                await asyncio.sleep(delay)
 
-                except Exception as e:
-                    logger.warning(f"RSS 피드 크롤링 오류 {feed_url}: {e}")
+        self._dead_hosts.add(host)
+        logger.warning(f"요청 최종 실패 {url} ({failure}) - 이번 크롤에서 {host} 제외")
+        return None
 
-        return results
+    async def _crawl_rss_feeds(
+        self, session: aiohttp.ClientSession, keywords: List[str] = None
+    ) -> List[Dict[str, Any]]:
+        """RSS 피드에서 공고 수집 (피드별 요청을 동시에 수행)"""
+        if not self.rss_feeds:
+            logger.info("RSS 피드 URL이 설정되지 않음 - 스킵")
+            return []
 
-    async def _crawl_web_search(self, keywords: List[str]) -> List[Dict[str, Any]]:
-        """웹 검색을 통한 공고 수집"""
-        results = []
+        feed_results = await asyncio.gather(
+            *[self._fetch_rss_feed(session, feed_url, keywords) for feed_url in self.rss_feeds]
+        )
 
-        connector = aiohttp.TCPConnector(ssl=create_ssl_context())
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=45),
-            connector=connector
-        ) as session:
+        return [item for items in feed_results for item in items]
 
-            for keyword in keywords[:3]:  # 최대 3개 키워드
-                try:
-                    logger.info(f"이탈리아 웹 검색: {keyword}")
-
-                    # MEPA 검색 페이지
-                    search_url = f"{self.mepa_base_url}/opencms/opencms/gare"
-                    search_params = {
-                        "q": keyword,
-                        "tipo": "gare",
-                        "stato": "aperto"
-                    }
+    async def _fetch_rss_feed(
+        self, session: aiohttp.ClientSession, feed_url: str, keywords: List[str] = None
+    ) -> List[Dict[str, Any]]:
+        """RSS 피드 하나를 받아 파싱"""
+        try:
+            logger.info(f"이탈리아 RSS 피드 크롤링: {feed_url}")
+
+            # 디코딩 없이 바이트로 받아 XML 파서에 전달 (압축 해제는 aiohttp가 처리)
+            content = await self._fetch(session, feed_url, as_bytes=True)
+            if content is not None:
+                feed_results = await self._parse_rss_feed(content, keywords)
+                logger.info(f"RSS에서 {len(feed_results)}건 수집")
+                return feed_results
 
-                    async with session.get(search_url, params=search_params) as response:
-                        if response.status == 200:
-                            html_content = await response.text()
-                            search_results = await self._parse_search_results_it(html_content, keyword)
-                            results.extend(search_results)
-                            logger.info(f"웹 검색에서 {len(search_results)}건 수집")
-                        else:
-                            logger.warning(f"웹 검색 실패: {response.status}")
+        except Exception as e:
+            logger.warning(f"RSS 피드 크롤링 오류 {feed_url}: {e}")
 
-                    # 요청 간격 조절
-                    await asyncio.sleep(2)
+        return []
 
-                except Exception as e:
-                    logger.warning(f"웹 검색 오류 {keyword}: {e}")
+    async def _crawl_web_search(self, session: aiohttp.ClientSession, keywords: List[str]) -> List[Dict[str, Any]]:
+        """웹 검색을 통한 공고 수집 (키워드별 검색을 동시에 수행)"""
+        semaphore = asyncio.Semaphore(self.web_search_concurrency)
 
-        return results
+        keyword_results = await asyncio.gather(
+            *[
+                self._search_keyword_it(session, semaphore, keyword, index)
+                for index, keyword in enumerate(keywords[:3])  # 최대 3개 키워드
+            ]
+        )
+
+        return [item for search_results in keyword_results for item in search_results]
+
+    async def _search_keyword_it(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        keyword: str,
+        index: int,
+    ) -> List[Dict[str, Any]]:
+        """키워드 하나에 대한 MEPA 웹 검색"""
+        try:
+            # 요청 시작 시각을 조금씩 어긋나게 해 서버 부하 분산
+            if index:
+                await asyncio.sleep(self.web_search_stagger * index)
+
+            async with semaphore:
+                logger.info(f"이탈리아 웹 검색: {keyword}")
+
+                # MEPA 검색 페이지
+                search_url = f"{self.mepa_base_url}/opencms/opencms/gare"
+                search_params = {
+                    "q": keyword,
+                    "tipo": "gare",
+                    "stato": "aperto"
+                }
+
+                html_content = await self._fetch(session, search_url, params=search_params)
+                if html_content is not None:
+                    search_results = await self._parse_search_results_it(html_content, keyword)
+                    logger.info(f"웹 검색에서 {len(search_results)}건 수집")
+                    return search_results
+
+        except Exception as e:
+            logger.warning(f"웹 검색 오류 {keyword}: {e}")
+
+        return []
 
-    async def _crawl_consip_portal(self, keywords: List[str] = None) -> List[Dict[str, Any]]:
+    async def _crawl_consip_portal(
+        self, session: aiohttp.ClientSession, keywords: List[str] = None
+    ) -> List[Dict[str, Any]]:
         """CONSIP 포털 크롤링"""
         results = []
 
         try:
             logger.info("CONSIP 포털 크롤링")
 
-            connector = aiohttp.TCPConnector(ssl=create_ssl_context())
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=45),
-                connector=connector
-            ) as session:
-
-                # CONSIP 메인 페이지
-                async with session.get(self.gare_base_url) as response:
-                    if response.status == 200:
-                        html_content = await response.text()
-                        consip_results = await self._parse_consip_page(html_content, keywords)
-                        results.extend(consip_results)
-                        logger.info(f"CONSIP에서 {len(consip_results)}건 수집")
+            # CONSIP 메인 페이지
+            html_content = await self._fetch(session, self.gare_base_url)
+            if html_content is not None:
+                consip_results = await self._parse_consip_page(html_content, keywords)
+                results.extend(consip_results)
+                logger.info(f"CONSIP에서 {len(consip_results)}건 수집")
 
         except Exception as e:
             logger.warning(f"CONSIP 포털 크롤링 오류: {e}")
 
         return results
 
-    async def _parse_rss_feed(self, content: str, keywords: List[str] = None) -> List[Dict[str, Any]]:
+    async def _parse_rss_feed(self, content: Union[str, bytes], keywords: List[str] = None) -> List[Dict[str, Any]]:
         """RSS 피드 파싱"""
         results = []
 
-        try:
-            # XML 파싱
-            root = ET.fromstring(content)
-            items = root.findall(".//item")
+        # 항목마다 시각을 새로 구하지 않도록 파싱 시작 시 한 번만 계산
+        now = datetime.now()
+        bid_number_prefix = f"IT-RSS-{now.strftime('%Y%m%d')}-"
+        crawled_at = now.isoformat()
+        estimated_deadline = self._estimate_deadline_date_it(now)
 
-            for item in items:
+        try:
+            # XML 스트리밍 파싱 (item 단위)
+            for item in _iter_rss_items(content):
                 try:
                     title = item.find("title")
                     title_text = title.text if title is not None else ""
@@ -240,51 +589,58 @@ class ItalyMEPACrawler(BaseCrawler):
                     description = item.find("description")
                     description_text = description.text if description is not None else ""
 
+                    # 키워드 필터링 (이탈리아어 포함)
+                    if keywords and not self._matches_keywords_it(title_text + " " + description_text, keywords):
+                        continue
+
+                    # 의료기기 관련 여부를 먼저 확인하고, 관련 항목만 상세 파싱
+                    title_lower = title_text.lower()
+                    cpv_codes = self._extract_cpv_codes(description_text)
+                    if not self._is_healthcare_text_it(title_lower, cpv_codes):
+                        continue
+
+                    # 링크/게시일은 필터를 통과한 항목에서만 조회
                     link = item.find("link")
                     link_url = link.text if link is not None else ""
 
                     pub_date = item.find("pubDate")
                     pub_date_text = pub_date.text if pub_date is not None else ""
 
-                    # 키워드 필터링 (이탈리아어 포함)
-                    if keywords and not self._matches_keywords_it(title_text + " " + description_text, keywords):
-                        continue
+                    estimated_value = self._extract_value_it(description_text)
 
                     # 데이터베이스 스키마에 맞는 공고 정보 구성
                     tender_info = {
                         "title": title_text.strip()[:500],  # 길이 제한
                         "organization": self._extract_organization_it(description_text) or "Amministrazione Pubblica Italiana",
-                        "bid_number": f"IT-RSS-{datetime.now().strftime('%Y%m%d')}-{len(results)+1:03d}",
+                        "bid_number": f"{bid_number_prefix}{len(results)+1:03d}",
                         "announcement_date": self._parse_date_it(pub_date_text),
-                        "deadline_date": self._extract_deadline_it(description_text) or self._estimate_deadline_date_it(),
-                        "estimated_price": str(self._extract_value_it(description_text)) if self._extract_value_it(description_text) else "",
+                        "deadline_date": self._extract_deadline_it(description_text) or estimated_deadline,
+                        "estimated_price": str(estimated_value) if estimated_value else "",
                         "currency": "EUR",
                         "source_url": link_url.strip(),
                         "source_site": "IT_MEPA",
                         "country": "IT",
                         "keywords": keywords or [],
-                        "relevance_score": self._calculate_relevance_score_it(title_text, keywords[0] if keywords else ""),
+                        "relevance_score": self._calculate_relevance_score_it(title_lower, keywords[0] if keywords else ""),
                         "urgency_level": "medium",
                         "status": "active",
                         "extra_data": {
                             "description": description_text.strip()[:1000],  # 길이 제한
-                            "tender_type": self._determine_tender_type_it(title_text),
-                            "cpv_codes": self._extract_cpv_codes(description_text),
+                            "tender_type": self._determine_tender_type_it(title_lower),
+                            "cpv_codes": cpv_codes,
                             "notice_type": "RSS",
                             "language": "it",
-                            "crawled_at": datetime.now().isoformat()
+                            "crawled_at": crawled_at
                         }
                     }
 
-                    # 의료기기 관련 필터링
-                    if self._is_healthcare_related_it(tender_info):
-                        results.append(tender_info)
+                    results.append(tender_info)
 
                 except Exception as e:
                     logger.warning(f"RSS 아이템 파싱 오류: {e}")
                     continue
 
-        except ET.ParseError as e:
+        except RSS_PARSE_ERRORS as e:
             logger.warning(f"RSS XML 파싱 오류: {e}")
 
         return results
@@ -293,63 +649,50 @@ class ItalyMEPACrawler(BaseCrawler):
         """이탈리아어 검색 결과 파싱"""
         results = []
 
-        try:
-            import re
-
-            # 이탈리아어 공고 제목 패턴
-            title_patterns = [
-                r'<h[2-4][^>]*>([^<]*(?:gara|bando|appalto|procedura)[^<]*)</h[2-4]>',
-                r'title="([^"]*(?:gara|bando|appalto|procedura)[^"]*)"'
-            ]
-
-            # 링크 패턴
-            link_patterns = [
-                r'href="([^"]*(?:gara|bando|appalto)[^"]*)"',
-                r'href="([^"]*procedure[^"]*)"'
-            ]
-
-            titles = []
-            for pattern in title_patterns:
-                titles.extend(re.findall(pattern, html_content, re.IGNORECASE))
+        # 항목마다 시각을 새로 구하지 않도록 파싱 시작 시 한 번만 계산
+        now = datetime.now()
+        bid_number_prefix = f"IT-WEB-{now.strftime('%Y%m%d')}-"
+        today_iso = now.date().isoformat()
+        crawled_at = now.isoformat()
+        estimated_deadline = self._estimate_deadline_date_it(now)
 
-            links = []
-            for pattern in link_patterns:
-                links.extend(re.findall(pattern, html_content))
+        try:
+            entries = _scan_search_page(html_content)
 
-            # 제목과 링크 매칭
-            for i, title in enumerate(titles[:8]):  # 최대 8개
+            for i, (title, link) in enumerate(entries[:8]):  # 최대 8개
                 try:
-                    link_url = ""
-                    if i < len(links):
-                        link_url = urljoin(self.mepa_base_url, links[i])
+                    # 의료기기 관련 확인 (관련 없는 제목은 공고 정보를 만들지 않음)
+                    title_lower = title.lower()
+                    if not self._is_healthcare_text_it(title_lower):
+                        continue
+
+                    link_url = urljoin(self.mepa_base_url, link) if link else ""
 
                     tender_info = {
                         "title": title.strip()[:500],
-                        "organization": self._extract_organization_from_title_it(title) or "Amministrazione Pubblica Italiana",
-                        "bid_number": f"IT-WEB-{datetime.now().strftime('%Y%m%d')}-{i+1:03d}",
-                        "announcement_date": datetime.now().date().isoformat(),
-                        "deadline_date": self._estimate_deadline_date_it(),
+                        "organization": self._extract_organization_from_title_it(title_lower) or "Amministrazione Pubblica Italiana",
+                        "bid_number": f"{bid_number_prefix}{i+1:03d}",
+                        "announcement_date": today_iso,
+                        "deadline_date": estimated_deadline,
                         "estimated_price": "",
                         "currency": "EUR",
                         "source_url": link_url,
                         "source_site": "IT_MEPA",
                         "country": "IT",
                         "keywords": [keyword],
-                        "relevance_score": self._calculate_relevance_score_it(title, keyword),
+                        "relevance_score": self._calculate_relevance_score_it(title_lower, keyword),
                         "urgency_level": "medium",
                         "status": "active",
                         "extra_data": {
                             "description": f"검색 키워드: {keyword}",
-                            "tender_type": self._determine_tender_type_it(title),
+                            "tender_type": self._determine_tender_type_it(title_lower),
                             "notice_type": "WEB_SEARCH",
                             "language": "it",
-                            "crawled_at": datetime.now().isoformat()
+                            "crawled_at": crawled_at
                         }
                     }
 
-                    # 의료기기 관련 확인
-                    if self._is_healthcare_related_it(tender_info):
-                        results.append(tender_info)
+                    results.append(tender_info)
 
                 except Exception as e:
                     logger.warning(f"검색 결과 아이템 파싱 오류: {e}")
@@ -364,52 +707,52 @@ class ItalyMEPACrawler(BaseCrawler):
         """CONSIP 페이지 파싱"""
         results = []
 
-        try:
-            import re
-
-            # CONSIP 공고 패턴
-            title_patterns = [
-                r'<a[^>]*>([^<]*(?:procedura|gara|bando)[^<]*)</a>',
-                r'<td[^>]*>([^<]*(?:sanitario|medico|ospedaliero)[^<]*)</td>'
-            ]
+        # 항목마다 시각을 새로 구하지 않도록 파싱 시작 시 한 번만 계산
+        now = datetime.now()
+        bid_number_prefix = f"IT-CONSIP-{now.strftime('%Y%m%d')}-"
+        today_iso = now.date().isoformat()
+        crawled_at = now.isoformat()
+        estimated_deadline = self._estimate_deadline_date_it(now)
 
-            titles = []
-            for pattern in title_patterns:
-                titles.extend(re.findall(pattern, html_content, re.IGNORECASE))
+        try:
+            entries = _scan_consip_page(html_content)
 
-            for title in titles[:6]:  # 최대 6개
+            for title, link in entries[:6]:  # 최대 6개
                 try:
                     # 키워드 필터링
                     if keywords and not self._matches_keywords_it(title, keywords):
                         continue
 
+                    # 의료기기 관련 확인 (관련 없는 제목은 공고 정보를 만들지 않음)
+                    title_lower = title.lower()
+                    if not self._is_healthcare_text_it(title_lower):
+                        continue
+
                     tender_info = {
                         "title": title.strip()[:500],
                         "organization": "CONSIP",
-                        "bid_number": f"IT-CONSIP-{datetime.now().strftime('%Y%m%d')}-{len(results)+1:03d}",
-                        "announcement_date": datetime.now().date().isoformat(),
-                        "deadline_date": self._estimate_deadline_date_it(),
+                        "bid_number": f"{bid_number_prefix}{len(results)+1:03d}",
+                        "announcement_date": today_iso,
+                        "deadline_date": estimated_deadline,
                         "estimated_price": "",
                         "currency": "EUR",
-                        "source_url": self.gare_base_url,
+                        "source_url": urljoin(self.gare_base_url, link) if link else self.gare_base_url,
                         "source_site": "IT_MEPA",
                         "country": "IT",
                         "keywords": keywords or [],
-                        "relevance_score": self._calculate_relevance_score_it(title, keywords[0] if keywords else ""),
+                        "relevance_score": self._calculate_relevance_score_it(title_lower, keywords[0] if keywords else ""),
                         "urgency_level": "medium",
                         "status": "active",
                         "extra_data": {
                             "description": "CONSIP 포털",
-                            "tender_type": self._determine_tender_type_it(title),
+                            "tender_type": self._determine_tender_type_it(title_lower),
                             "notice_type": "CONSIP_PORTAL",
                             "language": "it",
-                            "crawled_at": datetime.now().isoformat()
+                            "crawled_at": crawled_at
                         }
                     }
 
-                    # 의료기기 관련 확인
-                    if self._is_healthcare_related_it(tender_info):
-                        results.append(tender_info)
+                    results.append(tender_info)
 
                 except Exception as e:
                     logger.warning(f"CONSIP 아이템 파싱 오류: {e}")
@@ -425,24 +768,12 @@ class ItalyMEPACrawler(BaseCrawler):
         if not keywords:
             return True
 
-        text_lower = text.lower()
-
-        # 영어 키워드 매칭
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                return True
-
-        # 이탈리아어 의료 키워드 매칭
-        for med_keyword in self.medical_keywords_it:
-            if med_keyword in text_lower:
-                return True
-
-        return False
-
-    def _determine_tender_type_it(self, title: str) -> str:
-        """이탈리아어 공고 유형 판단"""
-        title_lower = title.lower()
+        # 검색 키워드 + 이탈리아어 의료 키워드를 하나의 오토마톤으로 한 번에 매칭
+        matcher = build_keyword_matcher(tuple(keywords) + tuple(self.medical_keywords_it))
+        return matcher.matches(text.lower())
 
+    def _determine_tender_type_it(self, title_lower: str) -> str:
+        """이탈리아어 공고 유형 판단 (소문자 제목)"""
         if "aperto" in title_lower or "pubblico" in title_lower:
             return "OPEN"
         elif "ristretto" in title_lower or "limitato" in title_lower:
@@ -456,31 +787,15 @@ class ItalyMEPACrawler(BaseCrawler):
 
     def _extract_organization_it(self, text: str) -> str:
         """이탈리아어 발주기관 추출"""
-        import re
-
-        org_patterns = [
-            r"(Ministero[^,\n]+)",
-            r"(Regione[^,\n]+)",
-            r"(Comune[^,\n]+)",
-            r"(Provincia[^,\n]+)",
-            r"(Ospedale[^,\n]+)",
-            r"(ASL[^,\n]+)",
-            r"(Università[^,\n]+)",
-            r"(CONSIP[^,\n]*)",
-            r"(Azienda[^,\n]+)"
-        ]
-
-        for pattern in org_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in ORGANIZATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
         return "Ente Pubblico Italiano"
 
-    def _extract_organization_from_title_it(self, title: str) -> str:
-        """제목에서 발주기관 추출"""
-        title_lower = title.lower()
-
+    def _extract_organization_from_title_it(self, title_lower: str) -> str:
+        """제목에서 발주기관 추출 (소문자 제목)"""
         if "ospedale" in title_lower or "sanitario" in title_lower:
             return "Ospedale Italiano"
         elif "università" in title_lower:
@@ -496,19 +811,8 @@ class ItalyMEPACrawler(BaseCrawler):
 
     def _extract_value_it(self, text: str) -> Optional[float]:
         """이탈리아어 추정가격 추출"""
-        import re
-
-        # 이탈리아 금액 패턴
-        value_patterns = [
-            r"(\d+(?:\.\d+)*(?:,\d+)?)\s*€",
-            r"€\s*(\d+(?:\.\d+)*(?:,\d+)?)",
-            r"(\d+(?:\.\d+)*(?:,\d+)?)\s*euro",
-            r"importo[:\s]*(\d+(?:\.\d+)*(?:,\d+)?)",
-            r"valore[:\s]*(\d+(?:\.\d+)*(?:,\d+)?)"
-        ]
-
-        for pattern in value_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in VALUE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     value_str = match.group(1).replace(".", "").replace(",", ".")
@@ -520,69 +824,47 @@ class ItalyMEPACrawler(BaseCrawler):
 
     def _extract_deadline_it(self, text: str) -> Optional[str]:
         """이탈리아어 마감일 추출"""
-        import re
-
-        # 이탈리아 날짜 패턴
-        date_patterns = [
-            r"(\d{1,2}/\d{1,2}/\d{4})",
-            r"(\d{1,2}-\d{1,2}-\d{4})",
-            r"(\d{4}-\d{1,2}-\d{1,2})",
-            r"scadenza[:\s]*(\d{1,2}/\d{1,2}/\d{4})",
-            r"entro[:\s]*(\d{1,2}/\d{1,2}/\d{4})"
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
+        for pattern in DEADLINE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
 
         return None
 
     def _parse_date_it(self, date_str: str) -> str:
-        """이탈리아 날짜 형식 파싱"""
+        """이탈리아 날짜 형식 파싱 (인식할 수 없으면 오늘 날짜)"""
         try:
-            from datetime import datetime
-
-            # 이탈리아어 날짜 형식들
-            formats = [
-                "%a, %d %b %Y %H:%M:%S %Z",
-                "%a, %d %b %Y %H:%M:%S %z",
-                "%d/%m/%Y %H:%M:%S",
-                "%d/%m/%Y",
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d",
-            ]
+            parsed = _parse_rss_date(date_str.strip())
+            if parsed:
+                return parsed
+        except Exception:
+            pass
 
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(date_str.strip(), fmt)
-                    return dt.date().isoformat()
-                except ValueError:
-                    continue
+        return datetime.now().date().isoformat()
 
-            return datetime.now().date().isoformat()
+    def _is_healthcare_related_it(self, tender_info: Dict[str, Any], text_lower: Optional[str] = None) -> bool:
+        """이탈리아어 의료기기 관련 공고 확인 (text_lower: 호출 측에서 이미 소문자로 바꾼 제목)"""
+        # CPV 코드는 extra_data에 저장됨
+        extra_data = tender_info.get("extra_data") or {}
+        cpv_codes = extra_data.get("cpv_codes") or tender_info.get("cpv_codes") or ()
 
-        except Exception:
-            return datetime.now().date().isoformat()
+        if text_lower is None:
+            text_lower = f"{tender_info.get('title', '')} {tender_info.get('description', '')}".lower()
 
-    def _is_healthcare_related_it(self, tender_info: Dict[str, Any]) -> bool:
-        """이탈리아어 의료기기 관련 공고 확인"""
+        return self._is_healthcare_text_it(text_lower, cpv_codes)
+
+    def _is_healthcare_text_it(self, text_lower: str, cpv_codes: Sequence[str] = ()) -> bool:
+        """CPV 코드와 소문자 텍스트만으로 의료기기 관련 여부 확인 (공고 정보 구성 전 사전 필터)"""
         # CPV 코드 확인
-        cpv_codes = tender_info.get("cpv_codes", [])
-        if any(cpv.startswith(hc) for cpv in cpv_codes for hc in ["331", "336", "337"]):
+        if any(cpv[:3] in HEALTHCARE_CPV_PREFIXES for cpv in cpv_codes):
             return True
 
         # 이탈리아어 의료 키워드 확인
-        text = f"{tender_info.get('title', '')} {tender_info.get('description', '')}".lower()
-
-        return any(keyword in text for keyword in self.medical_keywords_it)
+        return self._medical_matcher.matches(text_lower)
 
     def _extract_cpv_codes(self, text: str) -> List[str]:
         """CPV 코드 추출"""
-        import re
-
-        cpv_pattern = r"CPV[:\s]*(\d{8})"
-        matches = re.findall(cpv_pattern, text, re.IGNORECASE)
+        matches = CPV_PATTERN.findall(text)
 
         return matches if matches else []
 
@@ -595,7 +877,8 @@ class ItalyMEPACrawler(BaseCrawler):
             url = result.get("source_url", "")
             title = result.get("title", "")
 
-            key = url if url else title
+            # 추적 파라미터나 끝 '/'만 다른 URL은 같은 공고로 취급
+            key = _canonical_url(url) if url else title
             if key and key not in seen_urls:
                 seen_urls.add(key)
                 unique_results.append(result)
@@ -611,20 +894,20 @@ class ItalyMEPACrawler(BaseCrawler):
         result = await self.crawl(keywords)
         return result.get("results", [])
 
-    def _estimate_deadline_date_it(self) -> str:
+    def _estimate_deadline_date_it(self, now: Optional[datetime] = None) -> str:
         """마감일 추정 (이탈리아 기준 30일 후)"""
+        now = now or datetime.now()
         try:
-            estimated_date = datetime.now() + timedelta(days=30)
+            estimated_date = now + timedelta(days=30)
             return estimated_date.date().isoformat()
         except Exception:
-            return datetime.now().date().isoformat()
+            return now.date().isoformat()
 
-    def _calculate_relevance_score_it(self, title: str, keyword: str) -> float:
-        """관련성 점수 계산 (이탈리아어)"""
-        if not keyword or not title:
+    def _calculate_relevance_score_it(self, title_lower: str, keyword: str) -> float:
+        """관련성 점수 계산 (이탈리아어, 소문자 제목)"""
+        if not keyword or not title_lower:
             return 5.0
 
-        title_lower = title.lower()
         keyword_lower = keyword.lower()
 
         # 완전 일치
@@ -632,8 +915,7 @@ class ItalyMEPACrawler(BaseCrawler):
             return 8.0
 
         # 부분 일치
-        for medical_kw in self.medical_keywords_it:
-            if medical_kw.lower() in title_lower:
-                return 7.0
+        if self._medical_matcher.matches(title_lower):
+            return 7.0
 
         return 5.0
\ No newline at end of file
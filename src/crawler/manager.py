@@ -29,17 +29,19 @@ class CrawlerManager:
 
     def __init__(self):
         self.scheduler = AsyncIOScheduler()
+        # TED와 Sweden은 같은 TED API를 호출하므로 호스트별 속도 제한을 공유
+        ted_host_limiters = {}
         self.crawlers = {
             "G2B": G2BCrawler(),
             "SAM.gov": SAMGovCrawler(),
-            "TED": TEDCrawler(),
+            "TED": TEDCrawler(host_limiters=ted_host_limiters),
             "UK_FTS": UKFTSCrawler(),
             "FR_BOAMP": FranceBOAMPCrawler(),
             "DE_VERGABESTELLEN": GermanyVergabestellenCrawler(),
             "IT_MEPA": ItalyMEPACrawler(),
             "ES_PCSP": SpainPCSPCrawler(),
             "NL_TENDERNED": NetherlandsTenderNedCrawler(),
-            "Sweden": TEDCrawler()  # Swedish USP handled by TED crawler
+            "Sweden": TEDCrawler(host_limiters=ted_host_limiters)  # Swedish USP handled by TED crawler
         }
         self.is_running = False
         self.last_run_results = {}
@@ -311,16 +313,33 @@ class CrawlerManager:
             }
 
     async def run_all_crawlers(self, keywords: Optional[List[str]] = None) -> Dict[str, Any]:
-        """모든 크롤러 실행"""
-        results = {}
+        """모든 크롤러 실행 (동시 실행 수는 CRAWLER_MAX_CONCURRENCY로 제한)"""
+        site_names = list(self.crawlers.keys())
+        semaphore = asyncio.Semaphore(max(1, settings.CRAWLER_MAX_CONCURRENCY))
+        logger.info(
+            f"전체 크롤러 실행 (최대 {settings.CRAWLER_MAX_CONCURRENCY}개 동시): {', '.join(site_names)}"
+        )
 
-        for site_name in self.crawlers.keys():
-            logger.info(f"{site_name} 크롤러 실행 중...")
-            result = await self.run_crawler(site_name, keywords)
-            results[site_name] = result
+        async def run_bounded(site_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.run_crawler(site_name, keywords)
+
+        outcomes = await asyncio.gather(
+            *[run_bounded(site_name) for site_name in site_names],
+            return_exceptions=True
+        )
 
-            # 크롤러 간 간격
-            await asyncio.sleep(5)
+        results = {}
+        for site_name, outcome in zip(site_names, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"❌ {site_name} 크롤러 실행 실패: {outcome}")
+                outcome = {
+                    "success": False,
+                    "site": site_name,
+                    "error": str(outcome),
+                    "total_found": 0
+                }
+            results[site_name] = outcome
 
         total_found = sum(r.get('total_found', 0) for r in results.values())
         success_count = sum(1 for r in results.values() if r.get('success', False))
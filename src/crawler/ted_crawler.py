@@ -21,14 +21,18 @@ from ..models.tender_notice import (
     CurrencyCode
 )
 from ..utils.cpv_filter import cpv_filter
+from ..utils.rate_limiter import AsyncRateLimiter
 
 
 class TEDCrawler(BaseCrawler):
     """TED API를 이용한 EU 입찰공고 수집"""
 
-    def __init__(self):
+    def __init__(self, host_limiters: Optional[Dict[str, AsyncRateLimiter]] = None):
         super().__init__("TED", "EU")
 
+        # 호스트별 요청 속도 제한 (같은 API를 쓰는 인스턴스끼리 dict를 공유)
+        self.host_limiters = host_limiters if host_limiters is not None else {}
+
         # TED API 설정 (2025년 공식 API)
         self.api_base_url = "https://api.ted.europa.eu"
         self.api_version = "v3.0"
@@ -57,8 +61,11 @@ class TEDCrawler(BaseCrawler):
         """HTTP 세션 반환"""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=30)
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._throttle_request)
             self.session = aiohttp.ClientSession(
                 timeout=timeout,
+                trace_configs=[trace_config],
                 headers={
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
                     "Accept": "application/json, text/plain, */*",
@@ -69,6 +76,14 @@ class TEDCrawler(BaseCrawler):
             )
         return self.session
 
+    async def _throttle_request(self, session, trace_config_ctx, params) -> None:
+        """요청 시작 전 호스트별 속도 제한 대기"""
+        host = params.url.host
+        limiter = self.host_limiters.get(host)
+        if limiter is None:
+            limiter = self.host_limiters[host] = AsyncRateLimiter(settings.TED_HOST_RATE_LIMIT_TPS)
+        await limiter.acquire()
+
     async def login(self) -> bool:
         """TED API는 로그인이 필요없음"""
         return True
@@ -727,35 +742,36 @@ class TEDCrawler(BaseCrawler):
     def _generate_sample_ted_data(self) -> List[Dict]:
         """TED 구조 기반 샘플 데이터 생성 (개발/테스트용)"""
         try:
+            today = datetime.now()
             sample_notices = [
                 {
                     "title": "Medical Equipment Procurement - Hospital Supplies",
                     "link": "https://ted.europa.eu/udl?uri=TED:NOTICE:123456-2025:TEXT:EN:HTML",
                     "description": "Procurement of medical diagnostic equipment for European hospitals",
-                    "publication_date": datetime.now().strftime("%Y-%m-%d"),
+                    "publication_date": today.strftime("%Y-%m-%d"),
                     "source": "ted_sample"
                 },
                 {
                     "title": "Healthcare IT Systems Implementation",
                     "link": "https://ted.europa.eu/udl?uri=TED:NOTICE:123457-2025:TEXT:EN:HTML",
                     "description": "Implementation of healthcare information systems across EU member states",
-                    "publication_date": (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d"),
+                    "publication_date": (today - timedelta(days=1)).strftime("%Y-%m-%d"),
                     "source": "ted_sample"
                 },
                 {
                     "title": "Laboratory Equipment and Reagents Supply",
                     "link": "https://ted.europa.eu/udl?uri=TED:NOTICE:123458-2025:TEXT:EN:HTML",
                     "description": "Supply of laboratory equipment and reagents for medical research facilities",
-                    "publication_date": (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d"),
+                    "publication_date": (today - timedelta(days=2)).strftime("%Y-%m-%d"),
                     "source": "ted_sample"
                 }
             ]
 
             # 헬스케어 관련 공고만 필터링
-            filtered_notices = []
-            for notice in sample_notices:
-                if self._contains_healthcare_keywords(notice["title"], notice["description"]):
-                    filtered_notices.append(notice)
+            filtered_notices = [
+                notice for notice in sample_notices
+                if self._contains_healthcare_keywords(notice["title"], notice["description"])
+            ]
 
             logger.info(f"📋 TED 샘플 데이터 생성: {len(filtered_notices)}건 (참고용 - 실제 데이터 아님)")
             return filtered_notices
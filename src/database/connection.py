@@ -6,7 +6,7 @@ SQLite 데이터베이스 연결 및 모델
 import os
 import asyncio
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Set, Tuple
 from sqlalchemy import create_engine, Column, Integer, String, DateTime, Float, Boolean, Text, JSON
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
@@ -129,13 +129,17 @@ class DatabaseManager:
     """데이터베이스 관리 클래스"""
     
     @staticmethod
-    async def save_bid_info(bid_info_list: List[Dict[str, Any]]):
-        """입찰 정보 저장"""
+    async def save_bid_info(bid_info_list: List[Dict[str, Any]], batch_size: int = 500):
+        """입찰 정보 저장 (ORM 객체를 건별로 만들지 않고 배치 단위 executemany INSERT)"""
+        from sqlalchemy import insert
+
         try:
             async with get_db_session() as session:
-                for bid_data in bid_info_list:
-                    bid_model = BidInfoModel(**bid_data)
-                    session.add(bid_model)
+                for start in range(0, len(bid_info_list), batch_size):
+                    await session.execute(
+                        insert(BidInfoModel),
+                        bid_info_list[start:start + batch_size]
+                    )
                 
                 await session.commit()
                 logger.info(f"{len(bid_info_list)}건의 입찰 정보 저장 완료")
@@ -144,6 +148,30 @@ class DatabaseManager:
             logger.error(f"입찰 정보 저장 실패: {e}")
             raise
     
+    @staticmethod
+    async def get_existing_bid_keys(source_site: str, bid_numbers: Iterable[str]) -> Set[Tuple[str, str]]:
+        """이미 저장된 (공고번호, 공고차수) 조회 - 재수집된 공고의 중복 저장 방지용"""
+        from sqlalchemy import select
+
+        bid_numbers = [bid_number for bid_number in dict.fromkeys(bid_numbers) if bid_number]
+        existing: Set[Tuple[str, str]] = set()
+        if not bid_numbers:
+            return existing
+
+        notice_order = BidInfoModel.extra_data['bid_notice_order'].as_string()
+
+        async with get_db_session() as session:
+            # SQLite 바인드 변수 개수 제한을 피하기 위해 나누어 조회
+            for start in range(0, len(bid_numbers), 500):
+                result = await session.execute(
+                    select(BidInfoModel.bid_number, notice_order)
+                    .where(BidInfoModel.source_site == source_site)
+                    .where(BidInfoModel.bid_number.in_(bid_numbers[start:start + 500]))
+                )
+                existing.update((bid_number, order or '') for bid_number, order in result.all())
+
+        return existing
+
     @staticmethod
     async def search_bids(keywords: List[str], limit: int = 50) -> List[BidInfoModel]:
         """키워드로 입찰 정보 검색"""
@@ -10,6 +10,13 @@ from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
+# orjson이 있으면 응답 직렬화에 사용 (크롤링 결과 등 큰 응답의 JSON 인코딩 비용 절감)
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
+
 try:
     from fastmcp import FastMCP
 except ImportError:
@@ -83,7 +90,8 @@ app = FastAPI(
     title="Seegene Bid Information MCP Server",
     description="씨젠을 위한 글로벌 입찰 정보 수집 및 분석 시스템",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse
 )
 
 # CORS 설정 - MCP 및 Copilot Studio 호환
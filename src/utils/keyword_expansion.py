@@ -3,6 +3,7 @@ Keyword Expansion System
 키워드 확장 및 검색어 개선 시스템
 """
 
+import logging
 import re
 from typing import List, Dict, Set, Any
 from dataclasses import dataclass
@@ -427,7 +428,7 @@ class KeywordExpansionEngine:
                     score *= 1.2
 
                 # 제목에 있으면 추가 점수
-                if 'title' in text.lower() and keyword_lower in text.lower():
+                if 'title' in text_lower:
                     score *= 1.5
 
                 total_score += score
@@ -436,7 +437,8 @@ class KeywordExpansionEngine:
         # 최대 점수 제한
         final_score = min(total_score, 10.0)
 
-        logger.debug(f"관련성 점수: {final_score:.2f}, 매칭 키워드: {matched_keywords}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"관련성 점수: {final_score:.2f}, 매칭 키워드: {matched_keywords}")
         return final_score
 
 
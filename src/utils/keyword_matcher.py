@@ -0,0 +1,72 @@
+"""
+Keyword Matcher
+다중 키워드 동시 매칭 유틸리티 (Aho-Corasick)
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick이 없는 경우 부분 문자열 순회로 대체
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """대소문자 구분 없는 다중 키워드 매처
+
+    키워드를 소문자로 한 번만 변환해 Aho-Corasick 오토마톤을 구성하고,
+    텍스트 한 번 순회로 모든 키워드 매칭을 찾는다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        # 소문자 키워드 -> 원문 키워드들 (대소문자만 다른 키워드 보존)
+        originals: Dict[str, Tuple[str, ...]] = {}
+        for keyword in keywords:
+            if not keyword:
+                continue
+            keyword_lower = keyword.lower()
+            if keyword not in originals.get(keyword_lower, ()):
+                originals[keyword_lower] = originals.get(keyword_lower, ()) + (keyword,)
+
+        self._patterns: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(originals.items())
+        self._automaton = None
+
+        if ahocorasick is not None and self._patterns:
+            automaton = ahocorasick.Automaton()
+            for keyword_lower, keyword_originals in self._patterns:
+                automaton.add_word(keyword_lower, keyword_originals)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def __bool__(self) -> bool:
+        return bool(self._patterns)
+
+    def matches(self, text_lower: str) -> bool:
+        """소문자 텍스트에 키워드가 하나라도 포함되어 있는지 확인"""
+        if self._automaton is not None:
+            for _ in self._automaton.iter(text_lower):
+                return True
+            return False
+
+        return any(keyword_lower in text_lower for keyword_lower, _ in self._patterns)
+
+    def extract(self, text_lower: str) -> Set[str]:
+        """소문자 텍스트에 포함된 원문 키워드 집합 반환"""
+        found: Set[str] = set()
+
+        if self._automaton is not None:
+            for _, keyword_originals in self._automaton.iter(text_lower):
+                found.update(keyword_originals)
+            return found
+
+        for keyword_lower, keyword_originals in self._patterns:
+            if keyword_lower in text_lower:
+                found.update(keyword_originals)
+        return found
+
+
+@lru_cache(maxsize=32)
+def build_keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """키워드 조합별 매처 (크롤러 인스턴스와 검색 간에 오토마톤 공유)"""
+    return KeywordMatcher(keywords)
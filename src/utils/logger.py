@@ -38,6 +38,9 @@ def setup_logger(name: str, level: str = "INFO"):
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name} - {message}",
             compression="zip"
         )
+
+        # 표준 logging 로거와 같은 방식으로 레벨 확인 (등록된 핸들러의 최소 레벨 기준)
+        loguru_logger.isEnabledFor = lambda level_no: level_no >= loguru_logger._core.min_level
         
         return loguru_logger
     
@@ -0,0 +1,38 @@
+"""
+Rate Limiter
+동시 코루틴 간 공유하는 비동기 요청 속도 제한
+"""
+
+import asyncio
+
+
+class AsyncRateLimiter:
+    """초당 요청 수 제한 (요청 시작 시각을 일정 간격으로 예약)
+
+    여러 코루틴이 동시에 호출해도 전체 요청 속도가 rate/period를 넘지 않는다.
+    예약은 await 없이 처리되므로 별도의 Lock이 필요 없고, 이벤트 루프에 묶인 상태가 없어
+    생성 시점과 무관하게 재사용할 수 있다.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self._interval = period / rate
+        self._next_time = 0.0
+
+    async def acquire(self) -> None:
+        """다음 요청 가능 시각까지 대기"""
+        now = asyncio.get_running_loop().time()
+        start_time = max(now, self._next_time)
+        self._next_time = start_time + self._interval
+
+        wait = start_time - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
@@ -0,0 +1,23 @@
+"""
+Retry Helpers
+HTTP 요청 재시도 공통 유틸리티
+"""
+
+import random
+from typing import Optional
+
+# 재시도할 일시적 오류 상태 코드 (과부하/게이트웨이 오류)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def get_retry_delay(
+    attempt: int,
+    backoff: float,
+    max_delay: float,
+    retry_after: Optional[str] = None,
+) -> float:
+    """지수 백오프 + 지터 (Retry-After 헤더가 있으면 우선, 최대 대기 시간 제한)"""
+    delay = backoff * (2 ** attempt) + random.uniform(0, backoff)
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, float(retry_after))
+    return min(delay, max_delay)
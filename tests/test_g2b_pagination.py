@@ -0,0 +1,198 @@
+"""G2B 페이지 동시 조회 / 요청 속도 제한 / 기존 저장 공고 조회 테스트"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.crawler.g2b_crawler import G2BCrawler
+from src.database import connection
+from src.database.connection import Base, DatabaseManager
+from src.utils.rate_limiter import AsyncRateLimiter
+
+
+class FakePages:
+    """페이지 번호를 기록하고 totalCount가 담긴 응답을 돌려주는 _fetch_page_json 대체"""
+
+    def __init__(self, total_count=None, last_page_with_items=None, wait_for_pages=None):
+        self.total_count = total_count
+        self.last_page_with_items = last_page_with_items
+        self.requested_pages = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # 지정한 수의 페이지가 모두 요청 중이 될 때까지 응답을 보류 (동시 요청 확인용)
+        self.wait_for_pages = wait_for_pages
+        self.all_started = asyncio.Event()
+
+    async def fetch(self, context, session, operation, query_prefix, page_no, category_label):
+        self.requested_pages.append(page_no)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if page_no > 1 and self.wait_for_pages:
+                if self.in_flight >= self.wait_for_pages:
+                    self.all_started.set()
+                await asyncio.wait_for(self.all_started.wait(), timeout=1)
+        finally:
+            self.in_flight -= 1
+
+        body = {}
+        if self.total_count is not None:
+            body["totalCount"] = self.total_count
+        has_items = self.last_page_with_items is None or page_no <= self.last_page_with_items
+        return {"page": page_no, "has_items": has_items, "response": {"body": body}}
+
+    async def parse(self, json_data, category, keywords, display_name=None, context=None):
+        return [json_data["page"]] if json_data["has_items"] else []
+
+
+def _crawler(monkeypatch, pages, max_pages=20):
+    crawler = G2BCrawler()
+    crawler.encoded_api_key = "test-key"
+    crawler.api_max_pages = max_pages
+    monkeypatch.setattr(crawler, "_fetch_page_json", pages.fetch)
+    monkeypatch.setattr(crawler, "_parse_api_response", pages.parse)
+    return crawler
+
+
+@pytest.mark.asyncio
+async def test_remaining_pages_fetched_concurrently(monkeypatch):
+    pages = FakePages(total_count=50 * 4 + 1, wait_for_pages=4)
+    crawler = _crawler(monkeypatch, pages)
+
+    results = await crawler._search_bid_public_info("getBidPblancListInfoThng", "물품", ["PCR"])
+
+    assert sorted(results) == [1, 2, 3, 4, 5]
+    assert pages.requested_pages[0] == 1
+    assert sorted(pages.requested_pages[1:]) == [2, 3, 4, 5]
+    assert pages.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_page_count_clamped_to_max_pages(monkeypatch):
+    pages = FakePages(total_count=100000)
+    crawler = _crawler(monkeypatch, pages, max_pages=5)
+
+    results = await crawler._search_bid_public_info("getBidPblancListInfoThng", "물품", ["PCR"])
+
+    assert sorted(pages.requested_pages) == [1, 2, 3, 4, 5]
+    assert sorted(results) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_single_page_result_makes_one_request(monkeypatch):
+    pages = FakePages(total_count=3)
+    crawler = _crawler(monkeypatch, pages)
+
+    assert await crawler._search_bid_public_info("getBidPblancListInfoThng", "물품", ["PCR"]) == [1]
+    assert pages.requested_pages == [1]
+
+
+@pytest.mark.asyncio
+async def test_without_total_count_pages_until_empty(monkeypatch):
+    pages = FakePages(total_count=None, last_page_with_items=3)
+    crawler = _crawler(monkeypatch, pages)
+
+    results = await crawler._search_bid_public_info("getBidPblancListInfoThng", "물품", ["PCR"])
+
+    assert results == [1, 2, 3]
+    assert pages.requested_pages == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_without_total_count_stops_at_max_pages(monkeypatch):
+    pages = FakePages(total_count=None)
+    crawler = _crawler(monkeypatch, pages, max_pages=3)
+
+    results = await crawler._search_bid_public_info("getBidPblancListInfoThng", "물품", ["PCR"])
+
+    assert results == [1, 2, 3]
+    assert pages.requested_pages == [1, 2, 3]
+
+
+def test_rate_limiter_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_concurrent_acquires():
+    limiter = AsyncRateLimiter(rate=20)  # 0.05초 간격
+    loop = asyncio.get_running_loop()
+    started = []
+
+    async def request():
+        async with limiter:
+            started.append(loop.time())
+
+    await asyncio.gather(*[request() for _ in range(5)])
+
+    gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+    assert all(gap >= 0.04 for gap in gaps), gaps
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_first_acquire_does_not_wait():
+    limiter = AsyncRateLimiter(rate=1, period=10)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await limiter.acquire()
+
+    assert loop.time() - start < 0.05
+
+
+@pytest.fixture
+def temp_database(tmp_path, monkeypatch):
+    """임시 SQLite 파일을 get_db_session이 쓰도록 교체"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bids.db'}")
+    monkeypatch.setattr(connection, "async_engine", engine)
+    monkeypatch.setattr(
+        connection, "async_session_maker",
+        async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    return engine
+
+
+def _bid(bid_number, notice_order=None, source_site="G2B"):
+    extra_data = {} if notice_order is None else {"bid_notice_order": notice_order}
+    return {
+        "title": f"PCR 시약 구매 {bid_number}",
+        "bid_number": bid_number,
+        "source_url": f"https://example.com/{bid_number}",
+        "source_site": source_site,
+        "extra_data": extra_data,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_existing_bid_keys(temp_database):
+    async with temp_database.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    await DatabaseManager.save_bid_info([
+        _bid("R25BK001", "000"),
+        _bid("R25BK001", "001"),
+        _bid("R25BK002"),
+        _bid("R25BK003", "000", source_site="TED"),
+    ] + [_bid(f"BULK{index:04d}", "000") for index in range(1200)])
+
+    existing = await DatabaseManager.get_existing_bid_keys(
+        "G2B", ["R25BK001", "R25BK002", "R25BK003", "", "R25BK001"]
+        + [f"BULK{index:04d}" for index in range(1200)]
+    )
+
+    assert {key for key in existing if not key[0].startswith("BULK")} == {
+        ("R25BK001", "000"), ("R25BK001", "001"), ("R25BK002", ""),
+    }
+    # 500개 단위로 나누어 조회해도 모두 찾아야 함
+    assert sum(1 for key in existing if key[0].startswith("BULK")) == 1200
+
+    await temp_database.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_existing_bid_keys_skips_query_without_bid_numbers(monkeypatch):
+    monkeypatch.setattr(connection, "async_session_maker", None)
+
+    assert await DatabaseManager.get_existing_bid_keys("G2B", ["", ""]) == set()
@@ -0,0 +1,147 @@
+"""G2B 날짜/가격/마감일 빠른 경로와 기존 strptime 구현 비교"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from src.crawler.g2b_crawler import (
+    DATE_FORMATS,
+    DATE_FORMATS_BY_LENGTH,
+    G2BCrawler,
+    _normalize_date,
+    _normalize_price,
+    _parse_deadline_value,
+)
+
+
+def _strptime_date(value):
+    """빠른 경로가 없는 경우의 날짜 변환 (입력 길이에 맞는 형식 우선)"""
+    preferred = DATE_FORMATS_BY_LENGTH.get(len(value), ())
+    fallback = tuple(fmt for fmt in DATE_FORMATS if fmt not in preferred)
+    for fmt in preferred + fallback:
+        try:
+            return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return value[:10] if len(value) >= 10 else value
+
+
+def _strptime_deadline(value):
+    """기존 parse_deadline 구현"""
+    for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d"]:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _float_price(value):
+    """기존 _format_price 구현"""
+    normalized = value.replace(",", "")
+    try:
+        price_num = float(normalized)
+    except ValueError:
+        filtered = "".join(ch for ch in normalized if ch.isdigit() or ch == '.')
+        if not filtered:
+            return value
+        try:
+            price_num = float(filtered)
+        except ValueError:
+            return value
+    return f"{int(price_num):,}원"
+
+
+DATE_SEEDS = [
+    "2025-01-15 10:30:00", "2025-01-15 10:30", "2025-01-15", "20250115103000",
+    "202501151030", "20250115", "2025/01/15", "2025.01.15", "2024-02-29", "2023-02-29",
+]
+PRICE_SEEDS = ["1000000", "1,000,000", "1234.56", "1,234.5원", "약 300만", "-500", "1e3", "", "원"]
+
+
+def _mutations(seeds, alphabet, count=5000, seed=11):
+    """시드 문자열에 문자 치환/삽입/삭제를 적용한 입력 생성 (경계 사례 탐색)"""
+    rng = random.Random(seed)
+    values = list(seeds)
+    for _ in range(count):
+        chars = list(rng.choice(seeds))
+        for _ in range(rng.randint(1, 2)):
+            index = rng.randrange(len(chars) + 1)
+            operation = rng.random()
+            if operation < 0.4 and chars:
+                chars[min(index, len(chars) - 1)] = rng.choice(alphabet)
+            elif operation < 0.7:
+                chars.insert(index, rng.choice(alphabet))
+            elif chars:
+                del chars[min(index, len(chars) - 1)]
+        values.append("".join(chars))
+    values.extend("".join(rng.choice("0123456789") for _ in range(rng.randint(6, 16))) for _ in range(count))
+    return values
+
+
+@pytest.mark.parametrize("value", [
+    "2025-01-15 10:30:00", "20250115", "20251125", "202511251030", "2025/11/25",
+    "2025-02-30", "2025011030", "2025/01/15 10:00", "0024-02-29", "2025-01-15 25:00:00",
+])
+def test_normalize_date_known_cases(value):
+    assert _normalize_date(value) == _strptime_date(value)
+
+
+def test_normalize_date_reads_compact_dates_by_length():
+    # 길이 순서 없이 형식을 시도하면 '%Y%m%d%H%M'이 '20251125'를 2025-01-01 02:05로 읽음
+    assert _normalize_date("20251125") == "2025-11-25"
+    assert G2BCrawler()._format_date(" 20251125 ") == "2025-11-25"
+
+
+def test_normalize_date_matches_strptime_path():
+    for value in _mutations(DATE_SEEDS, "0123456789-/.: T+"):
+        assert _normalize_date(value) == _strptime_date(value), value
+
+
+def test_parse_deadline_matches_strptime():
+    for value in _mutations(DATE_SEEDS, "0123456789-/.: T+") + ["202 -01-15", "2025- 1-15", "+025-01-15"]:
+        assert _parse_deadline_value(value) == _strptime_deadline(value), value
+
+
+def test_parse_deadline_wrapper():
+    crawler = G2BCrawler()
+
+    assert crawler.parse_deadline(" 2025-01-15 18:00:00 ") == datetime(2025, 1, 15, 18, 0, 0)
+    assert crawler.parse_deadline("2025.01.15") == datetime(2025, 1, 15)
+    assert crawler.parse_deadline("") is None
+    assert crawler.parse_deadline("마감일 미정") is None
+
+
+def _outcome(func, value):
+    """반환값 또는 예외 종류 ('1e999'처럼 두 구현 모두 OverflowError를 내는 입력 비교용)"""
+    try:
+        return func(value)
+    except Exception as e:
+        return type(e)
+
+
+def _exceeds_float_precision(value):
+    normalized = value.replace(",", "")
+    return normalized.isascii() and normalized.isdigit() and int(normalized) > 2 ** 53
+
+
+def test_normalize_price_matches_float_parsing():
+    for value in _mutations(PRICE_SEEDS[:-2], "0123456789,.원 -e+١") + PRICE_SEEDS:
+        if _exceeds_float_precision(value):
+            continue
+        assert _outcome(_normalize_price, value) == _outcome(_float_price, value), value
+
+
+def test_normalize_price_keeps_large_integers_exact():
+    # 정수 문자열은 float를 거치지 않으므로 2**53보다 큰 금액도 반올림되지 않음
+    assert _normalize_price("9746978325070191") == "9,746,978,325,070,191원"
+
+
+def test_format_price_wrapper():
+    crawler = G2BCrawler()
+
+    assert crawler._format_price("1234567") == "1,234,567원"
+    assert crawler._format_price(1234567) == "1,234,567원"
+    assert crawler._format_price(None) == ""
+    assert crawler._format_price("  ") == ""
@@ -0,0 +1,123 @@
+"""IT MEPA 키워드 매칭 / RSS 게시일 / RSS 스트리밍 파싱 테스트"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from src.crawler import it_mepa_crawler
+from src.crawler.it_mepa_crawler import (
+    RSS_DATE_FORMATS,
+    ItalyMEPACrawler,
+    _iter_rss_items,
+    _parse_rss_date,
+)
+from src.utils.keyword_matcher import build_keyword_matcher
+
+
+@pytest.fixture(scope="module")
+def crawler():
+    return ItalyMEPACrawler()
+
+
+def _substring_matches_it(crawler, text, keywords):
+    """기존 _matches_keywords_it 구현"""
+    if not keywords:
+        return True
+    text_lower = text.lower()
+    if any(keyword.lower() in text_lower for keyword in keywords):
+        return True
+    return any(med_keyword in text_lower for med_keyword in crawler.medical_keywords_it)
+
+
+@pytest.mark.parametrize("text", [
+    "Fornitura di reagenti PCR per laboratorio",
+    "Gara per DISPOSITIVI MEDICI",
+    "Servizio di pulizia uffici comunali",
+    "Real-Time pcr kit",
+    "Acquisto strumentazione medica e diagnostica",
+    "",
+])
+@pytest.mark.parametrize("keywords", [[], ["PCR"], ["Seegene", "Allplex"], ["kit"]])
+def test_matches_keywords_it_equals_substring_scan(crawler, text, keywords):
+    assert crawler._matches_keywords_it(text, keywords) == _substring_matches_it(crawler, text, keywords)
+
+
+def test_matcher_shared_with_other_crawlers(crawler):
+    assert crawler._medical_matcher is build_keyword_matcher(tuple(crawler.medical_keywords_it))
+    assert ItalyMEPACrawler()._medical_matcher is crawler._medical_matcher
+
+
+def _strptime_rss_date(value):
+    """기존 _parse_date_it 구현 (실패 시 None)"""
+    for fmt in RSS_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+RSS_DATE_SEEDS = [
+    "Mon, 15 Jan 2025 10:30:00 GMT", "Mon, 15 Jan 2025 10:30:00 +0100", "15/01/2025 10:30:00",
+    "15/01/2025", "5/1/2025", "2025-01-15 10:30:00", "2025-01-15", "2025-1-5",
+    "Tue, 29 Feb 2023 00:00:00 GMT", "Mon, 15 Foo 2025 10:30:00 GMT",
+]
+
+
+@pytest.mark.parametrize("value", RSS_DATE_SEEDS + [
+    "Mon, 15 Jan 2025 10:30:00 CET", "Xyz, 15 Jan 2025 10:30:00 GMT", "15/01/2025 10:75:00",
+    "2025-01-15 10:30:60", "Mon, 15 Jan 2025 10:30:00 +2460", "mon, 15 jan 2025 10:30:00 gmt",
+])
+def test_parse_rss_date_known_cases(value):
+    assert _parse_rss_date(value) == _strptime_rss_date(value)
+
+
+def test_parse_rss_date_matches_strptime():
+    rng = random.Random(5)
+    for _ in range(20000):
+        chars = list(rng.choice(RSS_DATE_SEEDS))
+        for _ in range(rng.randint(1, 2)):
+            index = rng.randrange(len(chars) + 1)
+            operation = rng.random()
+            char = rng.choice("0123456789-/: +ABCabcZ,")
+            if operation < 0.4 and chars:
+                chars[min(index, len(chars) - 1)] = char
+            elif operation < 0.7:
+                chars.insert(index, char)
+            elif chars:
+                del chars[min(index, len(chars) - 1)]
+        value = "".join(chars)
+        assert _parse_rss_date(value) == _strptime_rss_date(value), value
+
+
+RSS_FEED = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<rss version="2.0"><channel><title>Bandi</title>
+<item><title>Fornitura reagenti PCR - è urgente</title><link>https://example.it/1</link></item>
+<item><title>Servizio pulizia</title><link>https://example.it/2</link></item>
+</channel></rss>
+"""
+
+
+@pytest.fixture(params=["lxml", "stdlib"])
+def rss_parser(request, monkeypatch):
+    """lxml 설치 여부와 관계없이 같은 항목을 반환하는지 확인"""
+    if request.param == "lxml":
+        if it_mepa_crawler.lxml_etree is None:
+            pytest.skip("lxml 미설치")
+    else:
+        monkeypatch.setattr(it_mepa_crawler, "lxml_etree", None)
+    return _iter_rss_items
+
+
+@pytest.mark.parametrize("as_bytes", [True, False])
+def test_iter_rss_items(rss_parser, as_bytes):
+    # 바이트는 XML 선언의 인코딩으로, 이미 디코딩된 텍스트는 선언과 관계없이 그대로 읽어야 함
+    content = RSS_FEED.encode("iso-8859-1") if as_bytes else RSS_FEED
+
+    items = [(item.findtext("title"), item.findtext("link")) for item in rss_parser(content)]
+
+    assert items == [
+        ("Fornitura reagenti PCR - è urgente", "https://example.it/1"),
+        ("Servizio pulizia", "https://example.it/2"),
+    ]
@@ -0,0 +1,81 @@
+"""KeywordMatcher / build_keyword_matcher 테스트"""
+
+import random
+
+import pytest
+
+from src.utils import keyword_matcher
+from src.utils.keyword_matcher import KeywordMatcher, build_keyword_matcher
+from src.crawler.g2b_crawler import G2BCrawler
+
+
+KEYWORDS = ["PCR", "pcr", "분자진단", "Real-Time PCR", "시약", "he", "hers", "his", "she"]
+
+
+def _substring_matches(keywords, text_lower):
+    """기존 구현: 키워드마다 소문자 부분 문자열 검사"""
+    return any(keyword.lower() in text_lower for keyword in keywords if keyword)
+
+
+def _substring_extract(keywords, text_lower):
+    return {keyword for keyword in keywords if keyword and keyword.lower() in text_lower}
+
+
+def _random_texts(count=500, seed=7):
+    rng = random.Random(seed)
+    pieces = ["pcr", "PCR", "real-time ", "분자", "진단", "시약", "ushers", "his", "h", "e", "s", " ", "-", "x"]
+    return ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 8))) for _ in range(count)]
+
+
+@pytest.fixture(params=["automaton", "substring"])
+def matcher_factory(request, monkeypatch):
+    """pyahocorasick 사용 여부와 관계없이 같은 결과인지 확인"""
+    if request.param == "automaton":
+        if keyword_matcher.ahocorasick is None:
+            pytest.skip("pyahocorasick 미설치")
+    else:
+        monkeypatch.setattr(keyword_matcher, "ahocorasick", None)
+    return KeywordMatcher
+
+
+def test_matches_and_extract_equal_substring_scan(matcher_factory):
+    matcher = matcher_factory(KEYWORDS)
+
+    for text in _random_texts():
+        text_lower = text.lower()
+        assert matcher.matches(text_lower) == _substring_matches(KEYWORDS, text_lower), text
+        assert matcher.extract(text_lower) == _substring_extract(KEYWORDS, text_lower), text
+
+
+def test_overlapping_keywords_are_all_extracted(matcher_factory):
+    matcher = matcher_factory(["he", "she", "his", "hers"])
+
+    assert matcher.extract("ushers") == {"he", "she", "hers"}
+
+
+def test_case_variants_keep_original_keywords(matcher_factory):
+    matcher = matcher_factory(["PCR", "pcr", "Pcr", "PCR"])
+
+    assert matcher.extract("real-time pcr kit") == {"PCR", "pcr", "Pcr"}
+    assert not matcher.matches("elisa kit")
+
+
+def test_empty_keywords(matcher_factory):
+    matcher = matcher_factory(["", ""])
+
+    assert not matcher
+    assert not matcher.matches("anything")
+    assert matcher.extract("anything") == set()
+
+
+def test_build_keyword_matcher_is_cached():
+    assert build_keyword_matcher(("PCR", "시약")) is build_keyword_matcher(("PCR", "시약"))
+    assert build_keyword_matcher(("PCR", "시약")) is not build_keyword_matcher(("시약", "PCR"))
+
+
+def test_g2b_query_matcher_shared_between_instances():
+    first = G2BCrawler()._get_query_matcher(["PCR", "진단키트"])
+    second = G2BCrawler()._get_query_matcher(["PCR", "진단키트"])
+
+    assert first is second
+    assert first.extract("코로나 pcr 진단키트 구매") == {"PCR", "진단키트"}